@@ -1,24 +1,43 @@
 import csv
 import pandas as pd
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache, partial
 import os
-import zipfile
+
+# Upper bound on threads used to load symbol price files
+MAX_LOAD_WORKERS = 16
+
+# Columns of a Lean daily price file, which has no header row
+PRICE_FILE_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# (open, close) prices per (symbol, zip modification time), shared by every
+# positions file processed in one run
+_PRICE_CACHE = {}
+
+# Symbols share one trading calendar, so each date string is parsed once
+@lru_cache(maxsize=None)
 def parse_price_date(date_str):
     """Convert price file date format (YYYYMMDD HH:MM) to YYYY-MM-DD"""
     try:
-        # Remove time part and parse date
+        # Remove time part and check for eight digits
         date_part = date_str.split(' ')[0]
-        parsed_date = datetime.strptime(date_part, '%Y%m%d')
-        return parsed_date.strftime('%Y-%m-%d')
+        if len(date_part) != 8 or not (date_part.isascii() and date_part.isdigit()):
+            return None
+        
+        # Reject dates that don't exist, then reformat the text directly
+        date(int(date_part[0:4]), int(date_part[4:6]), int(date_part[6:8]))
+        return f"{date_part[0:4]}-{date_part[4:6]}-{date_part[6:8]}"
     except:
         return None
 
 def format_price(price):
-    """Convert price to float by dividing by 10000"""
-    # Simply divide by 10000 and return as float
+    """Convert price to float by dividing by 10000 (a scalar, Series or DataFrame)"""
+    # Simply divide by 10000 and return as float; on pandas objects this is
+    # one vectorized division over every price
     return price / 10000
 
-def load_symbol_prices(symbol):
+def load_symbol_prices(symbol, verbose=False):
     """Load price data for a specific symbol - returns both open and close prices"""
     
     
@@ -26,48 +45,47 @@ def load_symbol_prices(symbol):
         
         # Path to your ZIP file
         zip_path = f"C:/Users/ashish/Documents/Money_Face_Projects/Lean/Data/equity/usa/daily/{symbol.lower()}.zip"
-
-        # Open the ZIP file
-        with zipfile.ZipFile(zip_path, 'r') as z:
-            # List all files inside the ZIP
-            print(z.namelist())  # Optional: see available files
-
-            # Read the CSV file directly without extracting
-            csv_filename = z.namelist()[0]  # Or specify exact name, e.g., "data.csv"
-            df = pd.read_csv(z.open(csv_filename), header=None)
-            
-        
-        # Read price file (assuming no headers: Date, Open, High, Low, Close, Volume)
-        # df = pd.read_csv(price_file, header=None)
-        df.columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-        
-        # Convert dates and create price dictionaries
-        open_price_data = {}
-        close_price_data = {}
-        dates_list = []
-        
-        for _, row in df.iterrows():
-            original_date = str(row['Date'])
-            converted_date = parse_price_date(original_date)
-            
-            if converted_date:
-                open_price = row['Open']
-                close_price = row['Close']
-                open_price_data[converted_date] = open_price
-                close_price_data[converted_date] = close_price
-                dates_list.append(converted_date)
-        
-        # Sort dates chronologically
-        dates_list = sorted(dates_list)
         
-        print(f"Loaded {len(dates_list)} price records for {symbol}")
-        return open_price_data, close_price_data, dates_list
+        # Reuse prices loaded for an earlier positions file unless the zip changed
+        cache_key = (symbol, os.path.getmtime(zip_path))
+        cached_prices = _PRICE_CACHE.get(cache_key)
+        if cached_prices is not None:
+            return cached_prices
+
+        # Read the single CSV inside the ZIP without extracting it
+        # (no headers: Date, Open, High, Low, Close, Volume), keeping only
+        # the columns used below and the dates as text
+        df = pd.read_csv(
+            zip_path,
+            compression='zip',
+            header=None,
+            names=PRICE_FILE_COLUMNS,
+            usecols=['Date', 'Open', 'Close'],
+            dtype={'Date': str},
+        )
+        
+        # Convert dates column-wise and drop rows whose date can't be parsed
+        converted_dates = df['Date'].map(parse_price_date)
+        valid_rows = converted_dates.notna()
+        
+        # Index prices by date, keeping the last row of a repeated date,
+        # and sort dates chronologically
+        prices = df.loc[valid_rows, ['Open', 'Close']]
+        prices.index = pd.Index(converted_dates[valid_rows], name='Date')
+        prices = prices[~prices.index.duplicated(keep='last')].sort_index()
+        
+        if verbose:
+            print(f"Loaded {len(prices)} price records for {symbol}")
+        
+        symbol_prices = prices['Open'].rename(symbol), prices['Close'].rename(symbol)
+        _PRICE_CACHE[cache_key] = symbol_prices
+        return symbol_prices
     
     except Exception as e:
-        print(f"Error loading {price_file}: {e}")
-        return {}, {}, []
+        print(f"Error loading {symbol}: {e}")
+        return pd.Series(dtype=float, name=symbol), pd.Series(dtype=float, name=symbol)
 
-def create_next_day_prices_csv(symbols, close_output_file, open_output_file):
+def create_next_day_prices_csv(symbols, close_output_file, open_output_file, verbose=False):
     """
     Create CSV files where each row shows next day's prices
     
@@ -75,87 +93,50 @@ def create_next_day_prices_csv(symbols, close_output_file, open_output_file):
         symbols (list): List of symbol names
         close_output_file (str): Path to output CSV file for close prices
         open_output_file (str): Path to output CSV file for open prices
+        verbose (bool): Also print per-symbol load counts and sample rows
     """
     
     print("=" * 60)
     print("NEXT-DAY PRICES CSV GENERATOR")
     print("=" * 60)
     
-    # Load all symbol data
-    all_open_price_data = {}
-    all_close_price_data = {}
-    all_dates_lists = {}
-    
-    for symbol in symbols:
-        open_price_data, close_price_data, dates_list = load_symbol_prices(symbol)
-        all_open_price_data[symbol] = open_price_data
-        all_close_price_data[symbol] = close_price_data
-        all_dates_lists[symbol] = dates_list
-    
-    # Find common dates where all symbols have data
-    common_dates = None
-    for symbol in symbols:
-        symbol_dates = set(all_dates_lists[symbol])
-        if common_dates is None:
-            common_dates = symbol_dates
-        else:
-            common_dates = common_dates.intersection(symbol_dates)
+    # Symbols are loaded independently, so overlap their zip reads and parsing
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, max(1, len(symbols)))) as executor:
+        loaded_prices = list(executor.map(partial(load_symbol_prices, verbose=verbose), symbols))
+    
+    # One column per symbol in alphabetical order; the inner join keeps only
+    # the common dates where all symbols have data
+    ordered_symbols = sorted(symbols)
+    close_prices = pd.DataFrame()
+    open_prices = pd.DataFrame()
+    if loaded_prices:
+        open_prices = pd.concat([prices for prices, _ in loaded_prices], axis=1, join='inner')
+        close_prices = pd.concat([prices for _, prices in loaded_prices], axis=1, join='inner')
+        open_prices = open_prices.sort_index()[ordered_symbols]
+        close_prices = close_prices.sort_index()[ordered_symbols]
+    
+    common_dates = close_prices.index.tolist()
     
     if not common_dates:
         print("Error: No common dates found across all symbols")
         return
     
-    common_dates = sorted(common_dates)
     print(f"Found {len(common_dates)} common dates across all symbols")
     
-    # Create next-day price data for both open and close
-    next_day_close_data = []
-    next_day_open_data = []
-    
-    for i, current_date in enumerate(common_dates[:-1]):  # Exclude last date (no next day)
-        next_date = common_dates[i + 1]
-        
-        # Get next day's close prices for all symbols
-        close_row_data = {'Date': current_date}
-        open_row_data = {'Date': current_date}
-        
-        all_symbols_have_next_day = True
-        for symbol in symbols:
-            if next_date in all_close_price_data[symbol] and next_date in all_open_price_data[symbol]:
-                # Close prices
-                next_day_close_price = all_close_price_data[symbol][next_date]
-                float_close_price = format_price(next_day_close_price)
-                close_row_data[symbol] = float_close_price
-                
-                # Open prices
-                next_day_open_price = all_open_price_data[symbol][next_date]
-                float_open_price = format_price(next_day_open_price)
-                open_row_data[symbol] = float_open_price
-            else:
-                all_symbols_have_next_day = False
-                break
-        
-        # Only add row if all symbols have next day data
-        if all_symbols_have_next_day:
-            next_day_close_data.append(close_row_data)
-            next_day_open_data.append(open_row_data)
+    # Each row shows the next common date's prices, so the last date has no row
+    close_df = format_price(close_prices.iloc[1:]).reset_index(drop=True)
+    open_df = format_price(open_prices.iloc[1:]).reset_index(drop=True)
     
-    if not next_day_close_data:
+    if close_df.empty:
         print("Error: No valid next-day price data found")
         return
     
-    # Create DataFrames and export to CSV
-    # Reorder columns: Date first, then symbols in alphabetical order
-    ordered_columns = ['Date'] + sorted(symbols)
+    # Date first, then symbols in alphabetical order
+    close_df.insert(0, 'Date', common_dates[:-1])
+    open_df.insert(0, 'Date', common_dates[:-1])
     
-    # Close prices CSV
-    close_df = pd.DataFrame(next_day_close_data)
-    close_df = close_df[ordered_columns]
+    # Export to CSV
     close_df.to_csv(close_output_file, index=False)
-    
-    # Open prices CSV
-    open_df = pd.DataFrame(next_day_open_data)
-    open_df = open_df[ordered_columns]
     open_df.to_csv(open_output_file, index=False)
     
     print("=" * 60)
@@ -163,7 +144,7 @@ def create_next_day_prices_csv(symbols, close_output_file, open_output_file):
     print("=" * 60)
     print(f"Close prices output file: {close_output_file}")
     print(f"Open prices output file: {open_output_file}")
-    print(f"Rows created: {len(next_day_close_data)}")
+    print(f"Rows created: {len(close_df)}")
     print(f"Symbols included: {', '.join(sorted(symbols))}")
     print()
     print("CSV Format:")
@@ -171,12 +152,15 @@ def create_next_day_prices_csv(symbols, close_output_file, open_output_file):
     print("  • Example: July 6th row contains July 7th's prices")
     print("  • Prices are normalized (divided by 10,000)")
     print("  • Formatted with minimum 2 decimal places")
-    print()
-    print("Sample close prices data:")
-    print(close_df.head().to_string(index=False))
-    print()
-    print("Sample open prices data:")
-    print(open_df.head().to_string(index=False))
+    
+    # Rendering the sample rows formats both frames, so only on request
+    if verbose:
+        print()
+        print("Sample close prices data:")
+        print(close_df.head().to_string(index=False))
+        print()
+        print("Sample open prices data:")
+        print(open_df.head().to_string(index=False))
 
 def main():
     """Main function"""
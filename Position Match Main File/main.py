@@ -102,19 +102,44 @@ class PositionSimulation(QCAlgorithm):
         self.first_day_flag = True
         
         # Read psotion data of stratgey
-        self.df = pd.read_csv("spec_strat_01jymdx1bfex1r2ctetqmrfd4g_v1.csv")
+        with open("spec_strat_01jymdx1bfex1r2ctetqmrfd4g_v1.csv", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            
+            # Skip asset type row
+            next(reader)
+            position_rows = [dict(zip(header, row)) for row in reader]
+        
+        # Preserve only date field of each row date
+        position_dates = [datetime.strptime(row["Date"], '%Y-%m-%d').date() for row in position_rows]
+        
+        # Get sorted unique dates from positions file
+        self.csv_dates = np.array(sorted(set(position_dates)))
         
-        # Drop row at index 0
-        self.df = self.df.drop(0) 
+        # Map each csv date to its next and next to next csv dates
+        self.next_two_by_date = {
+            d: (self.csv_dates[i+1] if i+1 < len(self.csv_dates) else None,
+                self.csv_dates[i+2] if i+2 < len(self.csv_dates) else None)
+            for i, d in enumerate(self.csv_dates)
+        }
         
-        # Convert date colum to datetime type
-        self.df["Date"] = pd.to_datetime(self.df["Date"])
+        # Index position rows by date, only needed to build the tables below
+        rows_by_date = self._index_by_date(position_dates, position_rows)
         
-        # Preserve only date field of datetime 
-        self.df["Date"] = self.df["Date"].dt.date
+        # Precompute columns with non zero values for each date
+        self.held_cols_by_date = {d: self._held_columns(row) for d, row in rows_by_date.items()}
         
-        # Get sorted unique dates from positions dataframe
-        self.csv_dates = np.array(sorted(self.df["Date"].unique()))
+        # Parse allocations of held symbols once for each date
+        self.allocations_by_date = {
+            d: self._parse_allocations(row, self.held_cols_by_date[d])
+            for d, row in rows_by_date.items()
+        }
+        
+        # Precompute whether positions change from each date to the next csv date
+        self.day_traded_by_date = {
+            d: "No" if self.held_cols_by_date[d] == self.held_cols_by_date[next_d] else "Yes"
+            for d, next_d in zip(self.csv_dates, self.csv_dates[1:])
+        }
 
         # Set initial capital
         self.SetCash(100000.0)
@@ -143,8 +168,8 @@ class PositionSimulation(QCAlgorithm):
         # Run security initializer method to set fee and slippage model
         self.SetSecurityInitializer(init_sec)
 
-        # Initialize empty list
-        self.ticker_done_list = []
+        # Initialize empty set
+        self.ticker_done_list = set()
 
         # Spy symbol object(do not manipulate)
         self.spy = self.AddEquity("SPY", Resolution.Daily).Symbol
@@ -165,6 +190,19 @@ class PositionSimulation(QCAlgorithm):
         self.bsv_eq = self.AddEquity("BSV", Resolution.Daily)
         self.tbt_eq = self.AddEquity("TBT", Resolution.Daily)
         
+        # Invested symbols are refreshed from portfolio only after fills change positions
+        self.positions_dirty = True
+        self.invested_symbols = []
+        
+        # Cache ticker strings of symbol objects
+        self.symbol_strs = {}
+        
+        # Cache contract multipliers of all symbols (to be change when strategy change)
+        self.multipliers = {
+            sym: float(self.Securities[sym].SymbolProperties.ContractMultiplier)
+            for sym in (self.spy_symbol, self.mstr_symbol, self.bito_symbol, self.biti_symbol, self.bsv_symbol, self.tbt_symbol)
+        }
+        
         # Disable buying power checks for this security (to be change when strategy change)
         self.spy_eq.SetBuyingPowerModel(NullBuyingPowerModel())
         self.mstr_eq.SetBuyingPowerModel(NullBuyingPowerModel())
@@ -175,7 +213,10 @@ class PositionSimulation(QCAlgorithm):
 
         self.trade_prices_df_columns = ['Symbol', 'Direction', 'FillQty', 'FillPrice', 'Time']
 
-        self.trade_prices_df = pd.DataFrame(columns=self.trade_prices_df_columns)
+        # Write filled orders to csv row by row as they arrive
+        self.trade_prices_file = open("trade_prices.csv", "w", newline="")
+        self.trade_prices_writer = csv.writer(self.trade_prices_file)
+        self.trade_prices_writer.writerow(self.trade_prices_df_columns)
 
         # If you use position groups (e.g., options), also disable group-level checks
         self.Portfolio.SetPositions(SecurityPositionGroupModel.NULL)
@@ -201,13 +242,21 @@ class PositionSimulation(QCAlgorithm):
         # Initialize dates list
         self.dates_list = []
         
-        # Create empty dataframe for storing results
-        self.result_df = pd.DataFrame(columns=[
+        # Write daily positions to csv, appending each day's rows as they are computed
+        self.result_df_columns = [
             "date","symbol","quantity","avg_price","market_price",
             "holding_value","unrealized_pnl","portfolio_value","cash", "Percentage"
-        ])
+        ]
+        self.result_file = open("simulated_daily_positions_QC.csv", "w", newline="")
+        self.result_writer = csv.writer(self.result_file)
+        self.result_writer.writerow(self.result_df_columns)
         self.close_price = pd.read_csv("Next Day Close Prices And Open Prices/next_day_close_prices_spec_strat_01jymdx1bfex1r2ctetqmrfd4g_v1.csv", parse_dates=['Date'])
         self.open_price = pd.read_csv("next_day_open_prices_spec_strat_01jymdx1bfex1r2ctetqmrfd4g_v1.csv", parse_dates=['Date'])
+        
+        # Index next day prices by date as {symbol: price} records
+        self.close_by_date = self._index_by_date(self.close_price['Date'].dt.date, self.close_price.to_dict(orient='records'))
+        self.open_by_date = self._index_by_date(self.open_price['Date'].dt.date, self.open_price.to_dict(orient='records'))
+        
         # Initialize empty dictionary
         self.map_dict = {}
         self.exit_today = False
@@ -216,17 +265,59 @@ class PositionSimulation(QCAlgorithm):
 
     # This gets invoked when order gets filled
     def OnOrderEvent(self, e):
+        
+        # Mark positions as changed for daily positions update on any fill, partial ones included
+        if e.FillQuantity != 0:
+            self.positions_dirty = True
+        
         if e.Status == OrderStatus.Filled:
             self.Debug(f"Order filled: {e.Symbol} - {e.Direction} {e.FillQuantity} @ {e.FillPrice} at {self.time}")
             
-            # Create dataframe for trade fill prices and save it
-            row = [[e.Symbol, e.Direction, e.FillQuantity, e.FillPrice, self.time]]
-            temp_price_df = pd.DataFrame(row, columns=self.trade_prices_df_columns)
-            self.trade_prices_df = pd.concat([self.trade_prices_df, temp_price_df], ignore_index=True)
-            self.trade_prices_df.to_csv("trade_prices.csv", index=False)
+            # Append trade fill price row, saved at end of day
+            self.trade_prices_writer.writerow([self._symbol_str(e.Symbol), e.Direction, e.FillQuantity, e.FillPrice, self.time])
+
+    # Method to get ticker string of symbol object
+    def _symbol_str(self, sym):
+        sym_str = self.symbol_strs.get(sym)
+        if sym_str is None:
+            sym_str = self.symbol_strs[sym] = str(sym)
+        
+        return sym_str
+
+    # Method to map each date to its first row
+    def _index_by_date(self, dates, rows):
+        rows_by_date = {}
+        for row_date, row in zip(dates, rows):
+            rows_by_date.setdefault(row_date, row)
+        
+        return rows_by_date
+
+    # Method to get columns with non zero values of a row
+    def _held_columns(self, row):
+        return tuple([col for col, value in row.items() if value.strip() not in {'-', '0.00%'}][2:])
+
+    # Method to get non zero allocations of held symbols, skipping $USD values
+    def _parse_allocations(self, row, held_cols):
+        allocations = {}
+        for col in held_cols:
+            if col == "$USD":
+                continue
+            allocation = self.get_float_val(row[col])
+            if allocation != 0:
+                allocations[col] = allocation
+        
+        return allocations
 
     # Method to get next and next to next date
     def _next_two_csv_dates(self, today):
+        next_two = self.next_two_by_date.get(today)
+        if next_two is None:
+            next_two = self.next_two_by_date[today] = self._search_next_two_csv_dates(today)
+        
+        return next_two
+
+    # Method to search next and next to next date for dates not in csv
+    def _search_next_two_csv_dates(self, today):
         i = np.searchsorted(self.csv_dates, today, side="right")  # strictly after today
         if i >= len(self.csv_dates):
             return None, None
@@ -239,111 +330,66 @@ class PositionSimulation(QCAlgorithm):
         '''Main algorithm logic executed on each data point'''
         
         # Get assume dcurrent date 
-        current_date = self.Time
-        
-        # Get string version of current date
-        current_date = current_date.strftime('%Y-%m-%d')
-        
-        # Get dataframe filter condition
-        current_daytemp_df_condition = self.df['Date'].astype(str) == current_date
-            
-        # Apply dataframe filter condition
-        current_daytemp_df = self.df[current_daytemp_df_condition]
-        
-        # If date is equal to start date then have empty row otherwise row of filtered df
-        if self.first_day_flag:
-            
-            current_day_row = pd.Series()
-        
-        else:
-        
-            current_day_row = current_daytemp_df.iloc[0]
+        current_date = self.Time.date()
         
         # Get next date and next to next date
-        next_date, next_to_next_date = self._next_two_csv_dates(self.Time.date())
+        next_date, next_to_next_date = self._next_two_csv_dates(current_date)
         
         if next_date is None:
             
             return
 
-        # convert dates into string format
-        next_date = next_date.strftime('%Y-%m-%d')
-
-        # GEt filtered df for assumed current day
-        next_date_temp_df_condition = self.df['Date'].astype(str) == next_date
-        next_date_temp_df = self.df[next_date_temp_df_condition]
-        
-        # Get row for assumed current day
-        next_day_row = next_date_temp_df.iloc[0]
-        
-        # Get columns with non zero values
-        next_day_cols = next_day_row.index[~next_day_row.astype(str).str.strip().isin({'-', '0.00%'})].tolist()[2:]
-        
-        # Get columns with non zero values
-        current_day_cols = current_day_row.index[~current_day_row.astype(str).str.strip().isin({'-', '0.00%'})].tolist()[2:]
-            
-        # Get value for assumed current day traded
-        if next_day_cols == current_day_cols:
-            
-            day_traded = "No"
-            
-        else:
-            
-            day_traded = "Yes"
-        
-        
-        # Always set day trade to yes for first day
+        # Always set day trade to yes for first day, otherwise use precomputed value for assumed current day
         if self.first_day_flag:
             
             day_traded = "Yes"
             
-            
             self.first_day_flag = False
+            
+        else:
+            
+            day_traded = self.day_traded_by_date[current_date]
                     
+        # Get portfolio once for this bar
+        portfolio = self.Portfolio
+        
         # Close position if assumed next day close positions
         if day_traded in ["Yes"]:        
             self.portfolio_value = 0
-            for kvp in self.Portfolio:  # kvp.Key = Symbol, kvp.Value = SecurityHolding
+            for kvp in portfolio:  # kvp.Key = Symbol, kvp.Value = SecurityHolding
                 sym = kvp.Key
                 h = kvp.Value
+                quantity = h.Quantity
                 # self.debug(f"{str(sym)=}, {h.Invested=}, {h.HoldingsValue=}, {h.Quantity=}")
-                if not h.Invested and abs(h.Quantity) == 0:
+                if not h.Invested and abs(quantity) == 0:
                     
                     continue
                 
                 # Close position if ticker is invested
-                exit_price = float(self.open_price[self.open_price['Date'].astype(str) == str(self.Time.date())][str(sym)].values[0])
-                self.market_on_open_order(str(sym), -h.Quantity)
-                self.portfolio_value += h.Quantity * exit_price
-                self.debug(f"Placed order to liquidate {sym} ({h.Quantity} @ {exit_price})")
+                ticker = self._symbol_str(sym)
+                exit_price = float(self.open_by_date[current_date][ticker])
+                self.market_on_open_order(ticker, -quantity)
+                self.portfolio_value += quantity * exit_price
+                self.debug(f"Placed order to liquidate {sym} ({quantity} @ {exit_price})")
 
             if self.portfolio_value == 0:
-                self.portfolio_value = self.Portfolio.TotalPortfolioValue
+                self.portfolio_value = portfolio.TotalPortfolioValue
             else:
                 self.exit_today = True
-                self.portfolio_value += self.Portfolio.Cash
+                self.portfolio_value += portfolio.Cash
                 
         # Take trade if assume current day needs to get position
         if day_traded in ["Yes"]:
                 
             self.map_dict = {}
 
-            # Get symbols for non zero values
-            list_of_symbols_with_positions = next_day_cols
-                        
-            # Remove $USD values
-            if "$USD" in list_of_symbols_with_positions:
-            
-                list_of_symbols_with_positions.remove("$USD")
-
-            # Get portfolio value
-            total = float(self.Portfolio.TotalPortfolioValue)
+            # Get close prices of assumed current day
+            close_prices = self.close_by_date[current_date]
 
-            # Iterate symbols            
-            for symbol in list_of_symbols_with_positions:
+            # Iterate symbols with non zero values and their parsed allocations
+            for symbol, allocation in self.allocations_by_date[next_date].items():
                 
-                price = float(self.close_price[self.close_price['Date'].astype(str) == str(self.Time.date())][symbol].values[0])
-                allocation = self.get_float_val(next_day_row[symbol])
+                price = float(close_prices[symbol])
 
                 # Calculate quantity
                 qty = (self.portfolio_value * allocation) / price
@@ -357,30 +403,48 @@ class PositionSimulation(QCAlgorithm):
         
         # Algorithm time is in the algo timezone.
         date = self.Time.strftime("%Y-%m-%d")
-        total = float(self.Portfolio.TotalPortfolioValue)
-        cash = float(self.Portfolio.Cash)
+        
+        # Bind portfolio, securities and caches to locals for the holdings loop
+        portfolio = self.Portfolio
+        securities = self.Securities
+        multipliers = self.multipliers
+        ticker_done_list = self.ticker_done_list
+        cash = float(portfolio.Cash)
         
         # Get QuantConnect's values for reference
-        qc_total_portfolio_value = float(self.Portfolio.TotalPortfolioValue)
+        qc_total_portfolio_value = float(portfolio.TotalPortfolioValue)
         
         # Calculate our own portfolio base for percentage calculations
         total_absolute_exposure = 0.0
         
-        # Create empty list of temporary rows
-        temp_rows = []
+        # Create empty list of invested holdings
+        holdings = []
+        
+        # Refresh invested symbols only when fills changed positions since last update
+        if self.positions_dirty:
+            self.invested_symbols = [kvp.Key for kvp in portfolio if kvp.Value.Invested or abs(kvp.Value.Quantity) != 0]
+            self.positions_dirty = False
         
-        # First pass: Calculate total absolute exposure
-        for kvp in self.Portfolio:
-            sym = kvp.Key
-            h = kvp.Value
-            if not h.Invested and abs(h.Quantity) == 0:
+        # Single pass: Collect invested holdings and calculate total absolute exposure
+        for sym in self.invested_symbols:
+            h = portfolio[sym]
+            quantity = float(h.Quantity)
+            if not h.Invested and quantity == 0:
                 continue
-            if str(sym) in self.ticker_done_list:
+            
+            sec = securities[sym]
+            price = float(sec.Price)
+            multiplier = multipliers.get(sym)
+            if multiplier is None:
+                multiplier = multipliers[sym] = float(sec.SymbolProperties.ContractMultiplier)
+            
+            # Current Exposure = Current Shares * Current Price
+            current_exposure = abs(quantity) * price * multiplier
+            sym_str = self._symbol_str(sym)
+            holdings.append((sym_str, h, sec, quantity, price, multiplier, current_exposure))
+            
+            if sym_str in ticker_done_list:
                 continue
-                
-            sec = self.Securities[sym]
-            multiplier = float(sec.SymbolProperties.ContractMultiplier)
-            current_exposure = abs(float(h.Quantity)) * float(sec.Price) * multiplier
             total_absolute_exposure += current_exposure
         
         # Determine the appropriate base for percentage calculations
@@ -391,58 +455,41 @@ class PositionSimulation(QCAlgorithm):
         if cash > 0 and qc_total_portfolio_value > total_absolute_exposure:
             portfolio_base = qc_total_portfolio_value
         
+        # Create empty list of temporary rows
+        temp_rows = []
+        
         # record all invested holdings
-        for kvp in self.Portfolio:  
-            
-            # Get symbol and object for all symbols records
-            sym = kvp.Key
-            h = kvp.Value
-            
-            # If symbol not invested then skip it
-            if not h.Invested and abs(h.Quantity) == 0:
-                
-                continue
+        for sym_str, h, sec, quantity, price, multiplier, current_exposure in holdings:
             
             # Get unrealised pnl 
-            sec = self.Securities[sym]
-            multiplier = float(sec.SymbolProperties.ContractMultiplier)
             upnl = float((sec.Price - h.AveragePrice) * h.Quantity * multiplier)
             
-            # Current Exposure = Current Shares * Current Price
-            current_exposure = abs(float(h.Quantity)) * float(sec.Price) * multiplier
-            
             # FIXED PERCENTAGE: Current Exposure / Portfolio Base * 100
             position_percentage = round((current_exposure / portfolio_base) * 100, 2)
             
-            # Append rows in list for creatiing temporray datafrma which will be concatenated with all dates dataframe
+            # Append rows in list for writing to csv
             temp_rows.append([
-                date, str(sym), float(h.Quantity), float(h.AveragePrice),
-                float(sec.Price), float(h.HoldingsValue), upnl, portfolio_base, cash, position_percentage
+                date, sym_str, quantity, float(h.AveragePrice),
+                price, float(h.HoldingsValue), upnl, portfolio_base, cash, position_percentage
             ])
             
-        # Update dataframe for invested holdings
-        headers = [
-            "date","symbol","quantity","avg_price","market_price",
-            "holding_value","unrealized_pnl","portfolio_value","cash", "Percentage"
-        ]
-        
-        # Create temporary dataframe for one date
-        temp_row_df = pd.DataFrame(columns=headers, data=temp_rows)
-        
-        # Concatenate dataframes of all dates and current date to get updated dataframe
-        self.result_df = pd.concat([self.result_df, temp_row_df], ignore_index=True)
-        
-        # Save Datafrmae to storage
-        self.result_df.to_csv("simulated_daily_positions_QC.csv", index=False)
+        # Append rows of invested holdings for this date and save them
+        self.result_writer.writerows(temp_rows)
+        self.result_file.flush()
                 
     def OnEndOfDay(self):
         
         # Update and write latest positions data csv file
         self.update_results_to_df()
+        
+        # Save trade fill prices of the day
+        self.trade_prices_file.flush()
 
     def OnEndOfAlgorithm(self):
         
-        pass
+        # Close output csv files
+        self.trade_prices_file.close()
+        self.result_file.close()
 
     # Method to strip % symbol and get percentage value in decimal
     def get_float_val(self, value):
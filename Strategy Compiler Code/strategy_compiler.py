@@ -1,4 +1,3 @@
-import json
 import zipfile
 import pandas as pd
 from io import StringIO
@@ -6,6 +5,9 @@ import os
 from datetime import datetime
 import sys
 
+from validators.logic_validator import StrategyValidationError
+from validators.spec_files import load_json_file
+
 class StrategyCompiler:
     
     # Constructor
@@ -127,14 +129,11 @@ class StrategyCompiler:
         '''
         This method loads the json file
         '''
-        # Reading the json file
-        with open(self.file_path, 'r') as file:
-            
-            # Loading the json file
-            json_data = json.load(file)
-            
-            # Returning the json data
-            return json_data
+        # Loading the json file (parsed from bytes with orjson when it is installed)
+        json_data = load_json_file(self.file_path)
+        
+        # Returning the json data
+        return json_data
         
     @staticmethod
     def write_py_file(filename: str, meta_code_lines: dict, setting_code_dict: dict, universe_code_lines: str, allowed_symbols: list, logic_code_dict: dict) -> None:
@@ -250,17 +249,21 @@ class StrategyCompiler:
         
         if not is_valid:
             
+            # Collect the report and write it with a single print
+            report_lines = []
+            
             if not self.if_list_is_empty(errors):
             
-                print(f"\n\nValidation errors:\n")
-                for error in errors:
-                    print(f"  Error: {error}")
+                report_lines.append(f"\n\nValidation errors:\n")
+                report_lines.extend([f"  Error: {error}" for error in errors])
             
             if not self.if_list_is_empty(warnings):
             
-                print(f"Validation warnings:\n")
-                for warning in warnings:
-                    print(f"  Warning: {warning}")
+                report_lines.append(f"Validation warnings:\n")
+                report_lines.extend([f"  Warning: {warning}" for warning in warnings])
+            
+            if report_lines:
+                print("\n".join(report_lines))
                     
     def check_if_dates_are_present(self, json_data: dict[str, any]) -> bool:
         '''
@@ -414,7 +417,13 @@ class StrategyCompiler:
         setting_code_dict = self.settings_generator.process_settings(json_data['settings'])
         
         # Validate logic field
-        self.logic_validator.validate_logic(json_data['logic'], allowed_symbols)
+        try:
+            self.logic_validator.validate_logic(json_data['logic'], allowed_symbols)
+        except StrategyValidationError as e:
+            
+            # Handle validation errors and close system
+            self.handle_validation_errors(False, e.errors, self.empty_list)
+            self.close_system_if_errors(False)
         
         # Get logic field code from the logic generator
         logic_code_dict = self.node_generator.generate_logic_code(json_data['logic'], json_data.get('universe'))
@@ -1,8 +1,9 @@
 """
-Pytest configuration and fixtures for MetaGenerator tests.
+Pytest configuration and fixtures for MetaGenerator and sample spec file tests.
 """
 
 import pytest
+import shutil
 from pathlib import Path
 import sys
 
@@ -70,3 +71,28 @@ def class_name_test_cases(request):
     return request.param
 
 
+@pytest.fixture(scope="module")
+def sample_inputs_root(tmp_path_factory):
+    """Temporary sample inputs directory with its test_strategy folder, created once per module."""
+    sample_dir = tmp_path_factory.mktemp("sample_inputs")
+    (sample_dir / "test_strategy").mkdir()
+    return sample_dir
+
+
+@pytest.fixture
+def temp_sample_dir(sample_inputs_root):
+    """Sample inputs directory holding an empty test_strategy folder."""
+    # Remove what the previous test wrote, keeping the test_strategy folder itself
+    for entry in sample_inputs_root.iterdir():
+        if entry.name == "test_strategy":
+            for child in entry.iterdir():
+                if child.is_dir():
+                    shutil.rmtree(child)
+                else:
+                    child.unlink()
+        elif entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+    
+    return sample_inputs_root
@@ -1,13 +1,14 @@
 import pytest
 from unittest.mock import patch
-from validators.logic_validator import LogicValidator, DEFAULT_ALLOWED_METRICS, METRICS_REQUIRE_PERIOD
+from validators import default_logic_validator
+from validators.logic_validator import LogicValidator, StrategyValidationError, DEFAULT_ALLOWED_METRICS, METRICS_REQUIRE_PERIOD
 
 
 # Global fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validator():
-    """Create a fresh LogicValidator instance for each test."""
-    return LogicValidator()
+    """Shared stateless LogicValidator instance."""
+    return default_logic_validator
 
 @pytest.fixture
 def allowed_symbols():
@@ -211,6 +212,21 @@ class TestValidateOrderNode:
         
         assert is_valid is False
         assert any("Symbols not allowed:" in error for error in errors)
+        assert "For order 'None', Symbols not allowed: AAPL, GOOGL" in errors
+    
+    def test_order_allowed_symbols_not_reused_across_lists(self, validator):
+        """Test each allowed symbols list is applied to its own call."""
+        node = {"type": "order", "side": "long", "weights": {"AAPL": 1.0}}
+        
+        is_valid, errors = validator.validate_order_node(node, ["aapl", "spy"])
+        assert is_valid is True
+        
+        is_valid, errors = validator.validate_order_node(node, ["SPY"])
+        assert is_valid is False
+        assert any("Symbols not allowed: AAPL" in error for error in errors)
+        
+        is_valid, errors = validator.validate_order_node(node, (s for s in ["AAPL"]))
+        assert is_valid is True
     
     def test_order_missing_weights(self, validator, allowed_symbols):
         """Test validation fails when weights are missing for symbols."""
@@ -225,6 +241,19 @@ class TestValidateOrderNode:
         assert is_valid is False
         assert any("Missing weight(s) for:" in error for error in errors)
     
+    def test_order_weight_keys_case_insensitive(self, validator, allowed_symbols):
+        """Test lowercase weight keys cover uppercase universe symbols."""
+        node = {
+            "type": "order",
+            "side": "long",
+            "universe": ["SPY", "TQQQ"],
+            "weights": {"spy": 0.5, "tqqq": 0.5}
+        }
+        is_valid, errors = validator.validate_order_node(node, allowed_symbols)
+        
+        assert is_valid is True
+        assert errors == []
+    
     def test_order_negative_weight(self, validator, allowed_symbols):
         """Test validation fails for negative weights."""
         node = {
@@ -250,6 +279,26 @@ class TestValidateOrderNode:
         assert is_valid is False
         assert any("Weight for SPY must be a number" in error for error in errors)
     
+    @pytest.mark.parametrize("invalid_weight", ["abc", None, 10 ** 400])
+    def test_order_unconvertible_weight(self, validator, allowed_symbols, invalid_weight):
+        """Test weights float() rejects are reported once and not compared to zero."""
+        node = {
+            "type": "order",
+            "side": "long",
+            "weights": {"SPY": invalid_weight}
+        }
+        is_valid, errors = validator.validate_order_node(node, allowed_symbols)
+        
+        assert is_valid is False
+        assert errors == ["For order 'None', Weight for SPY must be a number"]
+    
+    @pytest.mark.parametrize("weight", [1, 0.25, "0.5"])
+    def test_order_numeric_weight_forms(self, validator, allowed_symbols, weight):
+        """Test ints, floats and numeric strings are accepted as weights."""
+        node = {"type": "order", "side": "long", "weights": {"SPY": weight}}
+        
+        assert validator.validate_order_node(node, allowed_symbols) == (True, [])
+    
     def test_order_symbol_filter(self, validator, allowed_symbols):
         """Test validation with symbol_filter."""
         node = {
@@ -384,6 +433,10 @@ class TestValidateGroupNode:
         
         assert is_valid is False
         assert any("is not allowed here" in error for error in errors)
+        assert (
+            "For order 'None', group.child[0].type 'invalid_type' is not allowed here "
+            "(allowed: ['condition', 'exit', 'expression', 'filter', 'group', 'order', 'weight'])"
+        ) in errors
     
     def test_group_child_no_type(self, validator):
         """Test validation fails when child has no type."""
@@ -733,4 +786,283 @@ class TestValidateConditionNode:
             validate_else=True, else_label="else"
         )
         
-        assert is_valid is False
\ No newline at end of file
+        assert is_valid is False
+    
+    def test_condition_else_label_matched_case_insensitively(self, validator):
+        """Test the Else branch group is found by a trimmed, case-insensitive description."""
+        node = {
+            "type": "condition",
+            "operator": "gt",
+            "lhs": {"name": "rsi", "args": {"period": 14}, "symbol": "SPY"},
+            "rhs": 70,
+            "children": [
+                "not a node",
+                {"type": "order", "description": "Else branch"},
+                {"type": "group", "description": "  ELSE Branch ", "children": [{"type": "order"}]},
+                {"type": "group", "description": "else branch", "children": [{"type": "order"}]}
+            ]
+        }
+        is_valid, errors = validator.validate_condition_node(node, else_must_be_last=False)
+        
+        assert is_valid is False
+        assert errors == ["For condition 'None',condition has multiple Else branch groups; only one is allowed"]
+    
+    def test_condition_tuple_children_rejected(self, validator):
+        """Test children given as a tuple are reported as not an array."""
+        node = {
+            "type": "condition",
+            "operator": "gt",
+            "lhs": {"name": "rsi", "args": {"period": 14}, "symbol": "SPY"},
+            "rhs": 70,
+            "children": (
+                {"type": "order"},
+                {"type": "group", "description": "Else branch", "children": [{"type": "order"}]}
+            )
+        }
+        is_valid, errors = validator.validate_condition_node(node)
+        
+        assert is_valid is False
+        assert any("condition.children must be an array when provided" in error for error in errors)
+    
+    def test_condition_tuple_else_branch_children_rejected(self, validator):
+        """Test Else branch children given as a tuple are reported as not an array."""
+        node = {
+            "type": "condition",
+            "operator": "gt",
+            "lhs": {"name": "rsi", "args": {"period": 14}, "symbol": "SPY"},
+            "rhs": 70,
+            "children": [
+                {"type": "order"},
+                {"type": "group", "description": "Else branch", "children": ({"type": "order"},)}
+            ]
+        }
+        is_valid, errors = validator.validate_condition_node(node)
+        
+        assert is_valid is False
+        assert any("Else branch 'children' must be an array" in error for error in errors)
+    
+    def test_condition_allowed_lists_normalized_per_call(self, validator):
+        """Test allowed metrics and symbols are case-normalized for each call, including one-shot iterables."""
+        node = {"type": "condition", "operator": "gt", "lhs": {"name": "RSI", "args": {"period": 14}, "symbol": "spy"}, "rhs": 70}
+        
+        for _ in range(2):
+            is_valid, errors = validator.validate_condition_node(
+                node, allowed_metrics=(m for m in ["Rsi"]), allowed_symbols=iter(["Spy"])
+            )
+            assert is_valid is True
+        
+        is_valid, errors = validator.validate_condition_node(node, allowed_metrics=["sma"], allowed_symbols=["SPY"])
+        assert is_valid is False
+        assert any("metric.name 'RSI' is not in allowed_metrics" in error for error in errors)
+
+
+class TestValidateFilterNode:
+    
+    def _filter_node(self, universe):
+        return {
+            "id": "f1",
+            "type": "filter",
+            "universe": universe,
+            "select": "top",
+            "selection": {"n": 1},
+            "metric": {"name": "rsi", "args": {"period": 14}},
+        }
+    
+    def test_valid_filter_node(self, validator, allowed_symbols):
+        """Test universe symbols are matched after stripping and uppercasing."""
+        node = self._filter_node([" spy", "TQQQ ", "Spy"])
+        
+        is_valid, errors = validator.validate_filter_node(node, allowed_symbols=allowed_symbols)
+        assert is_valid is True
+        assert errors == []
+    
+    def test_filter_invalid_symbols_listed_once_in_order(self, validator, allowed_symbols):
+        """Test disallowed symbols are deduplicated and keep universe order."""
+        node = self._filter_node(["QQQ", "spy", "aapl", "qqq", " "])
+        
+        is_valid, errors = validator.validate_filter_node(node, allowed_symbols=allowed_symbols)
+        assert is_valid is False
+        assert errors == ["For filter 'f1', filter.universe contains symbols not allowed: QQQ, AAPL"]
+    
+    def test_filter_selection_counts_unique_symbols(self, validator, allowed_symbols):
+        """Test selection.n is compared against the deduplicated universe."""
+        node = self._filter_node(["SPY", "spy"])
+        node["selection"] = {"n": 2}
+        
+        is_valid, errors = validator.validate_filter_node(node, allowed_symbols=allowed_symbols)
+        assert is_valid is False
+        assert errors == ["For filter 'f1', filter.selection.n (2) cannot exceed universe size (1)"]
+    
+    @pytest.mark.parametrize("universe", [["SPY", "tqqq"], ["QQQ", "spy"], []])
+    def test_make_filter_validator_matches_validate_filter_node(self, validator, allowed_symbols, universe):
+        """Test the prebuilt validator reports the same results as validate_filter_node."""
+        check_filter = validator.make_filter_validator(allowed_symbols=allowed_symbols, allowed_metrics=["rsi"])
+        node = self._filter_node(universe)
+        
+        assert check_filter(node) == validator.validate_filter_node(
+            node, allowed_symbols=allowed_symbols, allowed_metrics=["rsi"]
+        )
+        
+        node["metric"]["name"] = "sma"
+        is_valid, errors = check_filter(node)
+        assert is_valid is False
+        assert "For filter 'f1', filter.metric.name 'sma' is not allowed" in errors
+    
+    def test_filter_node_not_dict(self, validator, allowed_symbols):
+        """Test a non-dict node is rejected instead of raising."""
+        is_valid, errors = validator.validate_filter_node("filter", allowed_symbols=allowed_symbols)
+        assert is_valid is False
+        assert errors == ["filter node must be a dict"]
+
+
+class TestValidateWeightNode:
+    
+    @pytest.mark.parametrize("method", ["explicit_weights", "inverse_volatility"])
+    def test_valid_weight_node(self, validator, allowed_symbols, method):
+        """Test each allocation method is accepted."""
+        node = {"id": "w1", "type": "weight", "allocation_method": method}
+        
+        is_valid, errors = validator.validate_weight_node(node, allowed_symbols)
+        assert is_valid is True
+        assert errors == []
+    
+    def test_weight_node_errors(self, validator, allowed_symbols):
+        """Test type and allocation_method errors are reported with the node id."""
+        is_valid, errors = validator.validate_weight_node({"id": "w1", "type": "order"}, allowed_symbols)
+        assert is_valid is False
+        assert errors == [
+            "For weight w1, Weight node must be a type 'weight'",
+            "For weight w1, Weight node must have an allocation_method",
+        ]
+        
+        node = {"id": "w2", "type": "weight", "allocation_method": "equal"}
+        is_valid, errors = validator.validate_weight_node(node, allowed_symbols)
+        assert is_valid is False
+        assert errors == [
+            "For weight w2, Weight node allocation_method must be one of: explicit_weights, inverse_volatility"
+        ]
+    
+    def test_weight_node_not_dict(self, validator, allowed_symbols):
+        """Test a non-dict node is rejected instead of raising."""
+        is_valid, errors = validator.validate_weight_node(["weight"], allowed_symbols)
+        assert is_valid is False
+        assert errors == ["Weight node must be a dict"]
+
+
+class TestCheckNodeTypeAndValidate:
+    
+    @pytest.mark.parametrize("node, expected_valid", [
+        ({"type": "order", "side": "long", "weights": {"SPY": 1.0}}, True),
+        ({"type": "order", "side": "long", "weights": {"AAPL": 1.0}}, False),
+        ({"type": "group", "children": [{"type": "order"}]}, True),
+        ({"type": "condition", "operator": "gt", "lhs": {"name": "rsi", "args": {"period": 14}, "symbol": "SPY"}, "rhs": 70}, True),
+    ])
+    def test_dispatches_on_node_type(self, validator, allowed_symbols, node, expected_valid):
+        """Test each node type is routed to its validator."""
+        with patch.object(LogicValidator, "handle_validation_errors") as handle:
+            validator.check_node_type_and_validate(node, allowed_symbols)
+        
+        is_valid, errors = handle.call_args.args
+        assert is_valid is expected_valid
+    
+    @pytest.mark.parametrize("node_type", ["unknown", None, ["order"]])
+    def test_unknown_node_type(self, validator, allowed_symbols, node_type):
+        """Test unknown or non-string node types are reported."""
+        with patch.object(LogicValidator, "handle_validation_errors") as handle:
+            validator.check_node_type_and_validate({"type": node_type}, allowed_symbols)
+        
+        handle.assert_called_once_with(False, [f"Unknown node type: {node_type}"])
+
+
+class TestTraceJsonData:
+    
+    def _traced_ids(self, validator, logic, allowed_symbols):
+        with patch.object(LogicValidator, "check_node_type_and_validate") as check:
+            validator.trace_json_data_recursive(logic, allowed_symbols)
+        
+        return [call.args[0].get("id") for call in check.call_args_list]
+    
+    def test_visits_nodes_depth_first_once(self, validator, allowed_symbols):
+        """Test every node below the root is validated once, parents before children."""
+        logic = {"id": "root", "children": [
+            {"id": "a", "type": "group", "children": [
+                {"id": "a1", "type": "order"},
+                {"id": "a2", "type": "group", "children": {"id": "a2x", "type": "order"}},
+            ]},
+            "not a node",
+            {"id": "b", "type": "order"},
+        ]}
+        
+        assert self._traced_ids(validator, logic, allowed_symbols) == ["a", "a1", "a2", "a2x", "b"]
+    
+    def test_root_without_children_is_validated(self, validator, allowed_symbols):
+        """Test a single node without children is validated itself."""
+        assert self._traced_ids(validator, {"id": "only", "type": "order"}, allowed_symbols) == ["only"]
+    
+    def test_deep_nesting_does_not_recurse(self, validator, allowed_symbols):
+        """Test logic nested deeper than the recursion limit is traced."""
+        import sys
+        
+        depth = sys.getrecursionlimit() + 100
+        node = {"id": depth, "type": "order"}
+        for i in range(depth - 1, 0, -1):
+            node = {"id": i, "type": "group", "children": [node]}
+        
+        assert self._traced_ids(validator, {"children": [node]}, allowed_symbols) == list(range(1, depth + 1))
+
+
+class TestValidateLogic:
+    
+    def test_handle_validation_errors_raises(self, validator):
+        """Test failing nodes raise instead of exiting the process."""
+        validator.handle_validation_errors(True, [])
+        
+        with pytest.raises(StrategyValidationError) as exc_info:
+            validator.handle_validation_errors(False, ["first", "second"])
+        
+        assert exc_info.value.errors == ["first", "second"]
+        assert str(exc_info.value) == "first\nsecond"
+    
+    def test_valid_logic_does_not_raise(self, validator, allowed_symbols):
+        """Test valid logic passes without raising."""
+        logic = {"type": "group", "children": [
+            {"type": "order", "side": "long", "weights": {"SPY": 1.0}},
+        ]}
+        
+        assert validator.validate_logic(logic, allowed_symbols) is None
+    
+    def test_errors_of_all_failing_nodes_are_raised_together(self, validator, allowed_symbols):
+        """Test the walk continues past a failing node and reports every error."""
+        logic = {"type": "group", "children": [
+            {"type": "unknown"},
+            {"type": "group", "children": [{"type": "mystery"}]},
+            {"type": "order", "side": "long", "weights": {"SPY": 1.0}},
+        ]}
+        
+        with pytest.raises(StrategyValidationError) as exc_info:
+            validator.validate_logic(logic, allowed_symbols)
+        
+        errors = exc_info.value.errors
+        assert errors[0] == "Unknown node type: unknown"
+        assert "group.child[0].type 'mystery' is not allowed here" in errors[1]
+        assert errors[2:] == ["Unknown node type: mystery"]
+
+
+class TestModuleConstants:
+    
+    def test_lookup_constants_are_frozensets(self):
+        """Test the per-node lookup sets are built once and can't be altered."""
+        from validators import logic_validator
+        
+        for name in ("_CONDITION_OPS", "_ORDER_SIDES", "_ORDER_SIZE_TYPES", "_ORDER_ALLOCATIONS",
+                     "_CROSS_OPS", "_COMPARISON_OPS", "_FILTER_SELECTS", "_SCHEMA_NODE_TYPES",
+                     "_WEIGHT_ALLOCATION_METHODS"):
+            assert isinstance(getattr(logic_validator, name), frozenset), name
+        
+        assert logic_validator._CONDITION_OPS == logic_validator._CROSS_OPS | logic_validator._COMPARISON_OPS
+    
+    def test_default_metric_sets_are_frozensets(self):
+        """Test the shared metric defaults can't be altered by a caller."""
+        assert isinstance(DEFAULT_ALLOWED_METRICS, frozenset)
+        assert isinstance(METRICS_REQUIRE_PERIOD, frozenset)
+        assert METRICS_REQUIRE_PERIOD <= DEFAULT_ALLOWED_METRICS
@@ -3,14 +3,15 @@ import json
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, mock_open
+from validators import default_meta_validator, spec_files
 from validators.meta_validator import MetaValidator
 
 
 # Global fixtures available to all test classes
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validator():
-    """Create a fresh MetaValidator instance for each test."""
-    return MetaValidator()
+    """Shared stateless MetaValidator instance."""
+    return default_meta_validator
 
 @pytest.fixture
 def valid_meta():
@@ -22,17 +23,19 @@ def valid_meta():
         "category": "momentum"
     }
 
-@pytest.fixture
-def temp_sample_dir(tmp_path):
-    """Create a temporary directory structure with sample files."""
-    sample_dir = tmp_path / "sample_inputs"
-    strategy_dir = sample_dir / "test_strategy"
-    strategy_dir.mkdir(parents=True)
-    return sample_dir
-
 
 class TestMetaValidator:
-    pass
+    
+    def test_results_not_shared_between_calls(self, validator):
+        """Test that a reused validator returns independent results per call."""
+        _, first_errors, first_warnings = validator.validate_meta_property({"extra": 1})
+        is_valid, errors, warnings = validator.validate_meta_property({"name": "Test", "version": "1.0"})
+        
+        assert is_valid is True
+        assert errors == []
+        assert warnings == []
+        assert len(first_errors) == 3
+        assert len(first_warnings) == 1
 
 
 class TestValidateMetaProperty:
@@ -122,6 +125,17 @@ class TestNameValidation:
         assert is_valid is False
         assert any("must be a string, got int" in error for error in errors)
     
+    @pytest.mark.parametrize("invalid_name,type_name", [
+        (None, "NoneType"), ([], "list"), ({}, "dict"), (True, "bool"), (1.5, "float"), ((), "tuple")
+    ])
+    def test_name_wrong_type_reports_type_name(self, validator, invalid_name, type_name):
+        """Test the wrong-type error names the actual type."""
+        meta = {"name": invalid_name, "version": "1.0"}
+        is_valid, errors, warnings = validator.validate_meta_property(meta, "test.json")
+        
+        assert is_valid is False
+        assert f"test.json: meta.name must be a string, got {type_name}" in errors
+    
     @pytest.mark.parametrize("invalid_name", [None, [], {}, 42, True])
     def test_name_invalid_types(self, validator, invalid_name):
         """Test validation fails for various invalid name types."""
@@ -147,7 +161,7 @@ class TestVersionValidation:
     
     @pytest.mark.parametrize("invalid_version", [
         "1", "1.", ".1", "1.0.", "1.0.0.", "v1.0", "1.0.0.0", 
-        "1.a", "a.1", "1.0.a", "", "1.0-beta", "1.0.0-alpha"
+        "1.a", "a.1", "1.0.a", "", "1.0-beta", "1.0.0-alpha", "1.0\n", "\u0661.\u0660"
     ])
     def test_invalid_version_patterns(self, validator, invalid_version):
         """Test various invalid version patterns."""
@@ -308,6 +322,24 @@ class TestAdditionalProperties:
         assert is_valid is True
         assert errors == []
         assert len(warnings) == 2
+    
+    def test_unexpected_property_warnings_keep_key_order(self, validator):
+        """Test warnings follow the order of the keys in the meta object."""
+        meta = {
+            "zeta": 1,
+            "name": "Test",
+            "alpha": 2,
+            "version": "1.0",
+            "source": "composer",
+            "middle": 3
+        }
+        is_valid, errors, warnings = validator.validate_meta_property(meta, "test.json")
+        
+        assert warnings == [
+            "test.json: Unexpected additional property 'meta.zeta' found",
+            "test.json: Unexpected additional property 'meta.alpha' found",
+            "test.json: Unexpected additional property 'meta.middle' found"
+        ]
 
 
 class TestValidateSampleFiles:
@@ -337,6 +369,18 @@ class TestValidateSampleFiles:
         assert is_valid is True
         assert errors == []
     
+    def test_validate_sample_files_returns_named_results(self, validator, temp_sample_dir):
+        """Test each file result exposes is_valid, errors and warnings by name."""
+        spec_file = temp_sample_dir / "test_strategy" / "spec_test.json"
+        spec_file.write_text(json.dumps({"meta": {"name": "Test", "version": "1.0", "extra": 1}}))
+        
+        result = validator.validate_sample_files(str(temp_sample_dir))[str(spec_file)]
+        
+        assert isinstance(result, spec_files.ValidationResult)
+        assert result.is_valid is True
+        assert result.errors == []
+        assert len(result.warnings) == 1
+    
     def test_validate_sample_files_invalid_json(self, validator, temp_sample_dir):
         """Test handling of invalid JSON files."""
         strategy_dir = temp_sample_dir / "test_strategy"
@@ -353,6 +397,22 @@ class TestValidateSampleFiles:
         assert is_valid is False
         assert any("JSON decode error" in error for error in errors)
     
+    def test_validate_sample_files_stdlib_json_fallback(self, validator, temp_sample_dir, monkeypatch):
+        """Test sample files are parsed with the json module when orjson is unavailable."""
+        monkeypatch.setattr(spec_files, "orjson", None)
+        strategy_dir = temp_sample_dir / "test_strategy"
+        (strategy_dir / "spec_valid.json").write_text(
+            json.dumps({"meta": {"name": "Test Strategy", "version": "1.0"}})
+        )
+        (strategy_dir / "spec_invalid.json").write_text('{"invalid": json}')
+        
+        results = validator.validate_sample_files(str(temp_sample_dir))
+        
+        assert results[str(strategy_dir / "spec_valid.json")] == (True, [], [])
+        is_valid, errors, warnings = results[str(strategy_dir / "spec_invalid.json")]
+        assert is_valid is False
+        assert any("JSON decode error" in error for error in errors)
+    
     def test_validate_sample_files_no_meta(self, validator, temp_sample_dir):
         """Test handling of files without meta property."""
         strategy_dir = temp_sample_dir / "test_strategy"
@@ -400,6 +460,37 @@ class TestValidateSampleFiles:
         for file_path, (is_valid, errors, warnings) in results.items():
             assert is_valid is True
             assert errors == []
+    
+    def test_validate_sample_files_on_process_pool(self, validator, temp_sample_dir):
+        """Test validating on worker processes gives the same results as threads."""
+        for i in range(3):
+            strategy_dir = temp_sample_dir / f"strategy_{i}"
+            strategy_dir.mkdir()
+            meta = {"name": f"Strategy {i}", "version": "1.0" if i else "bad"}
+            (strategy_dir / f"spec_{i}.json").write_text(json.dumps({"meta": meta}))
+        
+        thread_results = validator.validate_sample_files(str(temp_sample_dir))
+        process_results = validator.validate_sample_files(str(temp_sample_dir), use_processes=True)
+        
+        assert len(process_results) == 3
+        assert process_results == thread_results
+    
+    def test_validate_sample_files_ignores_non_spec_entries(self, validator, temp_sample_dir):
+        """Test only spec_*.json files one level below the directory are validated."""
+        spec_data = json.dumps({"meta": {"name": "Test Strategy", "version": "1.0"}})
+        strategy_dir = temp_sample_dir / "test_strategy"
+        (strategy_dir / "spec_test.json").write_text(spec_data)
+        (strategy_dir / "notes_test.json").write_text(spec_data)
+        (strategy_dir / "spec_test.txt").write_text(spec_data)
+        (strategy_dir / "spec_dir.json").mkdir()
+        (temp_sample_dir / "spec_top_level.json").write_text(spec_data)
+        nested_dir = strategy_dir / "nested"
+        nested_dir.mkdir()
+        (nested_dir / "spec_nested.json").write_text(spec_data)
+        
+        results = validator.validate_sample_files(str(temp_sample_dir))
+        
+        assert list(results) == [str(strategy_dir / "spec_test.json")]
 
 
 class TestGenerateValidationReport:
@@ -457,6 +548,16 @@ class TestValidatorConstants:
         }
         assert validator.VALID_CATEGORIES == expected_categories
     
+    def test_constants_are_class_level_frozensets(self, validator):
+        """Test that lookup constants are immutable and shared by the class."""
+        assert isinstance(MetaValidator.VALID_CATEGORIES, frozenset)
+        assert validator.VERSION_PATTERN is MetaValidator.VERSION_PATTERN
+    
+    def test_validator_has_no_instance_dict(self, validator):
+        """Test the validator uses empty __slots__ and carries no instance state."""
+        assert MetaValidator.__slots__ == ()
+        assert not hasattr(validator, "__dict__")
+    
     def test_version_pattern_constant(self, validator):
         """Test VERSION_PATTERN regex."""
         valid_versions = ["1.0", "2.1", "10.25", "1.0.0", "2.1.3"]
@@ -1,13 +1,30 @@
 import pytest
+from collections import OrderedDict
 from datetime import datetime
+from types import MappingProxyType
+from validators import default_settings_validator
 from validators.settings_validator import SettingsValidator
 
 
+# Minimal valid settings shared by tests; read-only so no test can alter it
+_BASE_SETTINGS = MappingProxyType({
+    "capital": 100000,
+    "rebalance": "daily",
+    "start": "2020-01-01",
+    "end": "2020-12-31"
+})
+
+
+def make_settings(**overrides):
+    """Build a new settings dict from the base settings with the given overrides."""
+    return {**_BASE_SETTINGS, **overrides}
+
+
 # Global fixtures available to all test classes
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validator():
-    """Create a fresh SettingsValidator instance for each test."""
-    return SettingsValidator()
+    """Shared stateless SettingsValidator instance."""
+    return default_settings_validator
 
 @pytest.fixture
 def valid_settings():
@@ -56,51 +73,82 @@ class TestValidateSettings:
         assert is_valid is True
         assert errors == []
     
-    def test_settings_not_dict(self, validator):
+    @pytest.mark.parametrize("settings", [None, [], "string", 123, True])
+    def test_settings_not_dict(self, validator, settings):
         """Test validation fails when settings is not a dictionary."""
-        test_cases = [None, [], "string", 123, True]
+        is_valid, errors = validator.validate_settings(settings)
         
-        for settings in test_cases:
-            is_valid, errors = validator.validate_settings(settings)
-            assert is_valid is False
-            assert any("Settings must be a dictionary/object" in error for error in errors)
+        assert is_valid is False
+        assert "Settings must be a dictionary/object" in "\n".join(errors)
+    
+    def test_dict_subclass_settings_accepted(self, validator, valid_settings):
+        """Test dict subclasses are still accepted as settings and nested objects."""
+        settings = OrderedDict(valid_settings)
+        settings["fees"] = OrderedDict(valid_settings["fees"])
+        is_valid, errors = validator.validate_settings(settings)
+        
+        assert is_valid is True
+        assert errors == []
     
     def test_empty_settings(self, validator):
         """Test validation with empty settings dictionary."""
         is_valid, errors = validator.validate_settings({})
         
         assert is_valid is False
-        assert any("Capital is required" in error for error in errors)
-        assert any("Rebalance is required" in error for error in errors)
-        assert any("Start is required" in error for error in errors)
-        assert any("End is required" in error for error in errors)
+        assert "Capital is required" in "\n".join(errors)
+        assert "Rebalance is required" in "\n".join(errors)
+        assert "Start is required" in "\n".join(errors)
+        assert "End is required" in "\n".join(errors)
+    
+    def test_errors_reported_in_field_order(self, validator):
+        """Test errors follow the settings field order, with date logic last."""
+        settings = {
+            "slippage": "invalid",
+            "fees": "invalid",
+            "currency": 1,
+            "end": "2020-01-01",
+            "start": "2020-12-31",
+            "rebalance": 1,
+            "capital": -1
+        }
+        is_valid, errors = validator.validate_settings(settings)
+        
+        assert is_valid is False
+        assert errors == [
+            "Capital must be greater than or equal to 0",
+            "Rebalance must be a string",
+            "Currency must be a string",
+            "Fees must be an object/dictionary",
+            "Slippage must be an object/dictionary",
+            "Start date must be on or before end date"
+        ]
 
 
 class TestCapitalValidation:
     
     def test_valid_capital_integer(self, validator):
         """Test valid integer capital."""
-        settings = {"capital": 100000, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings()
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Capital" in error for error in errors)
+        assert "Capital" not in "\n".join(errors)
     
     def test_valid_capital_float(self, validator):
         """Test valid float capital."""
-        settings = {"capital": 100000.50, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(capital=100000.50)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Capital" in error for error in errors)
+        assert "Capital" not in "\n".join(errors)
     
     def test_valid_capital_zero(self, validator):
         """Test capital with zero value (should be valid)."""
-        settings = {"capital": 0, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(capital=0)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Capital" in error for error in errors)
+        assert "Capital" not in "\n".join(errors)
     
     def test_missing_capital(self, validator):
         """Test validation fails when capital is missing."""
@@ -108,34 +156,34 @@ class TestCapitalValidation:
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Capital is required" in error for error in errors)
+        assert "Capital is required" in "\n".join(errors)
     
     def test_capital_none(self, validator):
         """Test validation fails when capital is None."""
-        settings = {"capital": None, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(capital=None)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Capital is required" in error for error in errors)
+        assert "Capital is required" in "\n".join(errors)
     
     def test_capital_negative(self, validator):
         """Test validation fails for negative capital."""
-        settings = {"capital": -1000, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(capital=-1000)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Capital must be greater than or equal to 0" in error for error in errors)
+        assert "Capital must be greater than or equal to 0" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_capital", [
         "100000", [], {}, True, False
     ])
     def test_capital_invalid_types(self, validator, invalid_capital):
         """Test validation fails for non-numeric capital types."""
-        settings = {"capital": invalid_capital, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(capital=invalid_capital)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Capital must be a number" in error for error in errors)
+        assert "Capital must be a number" in "\n".join(errors)
 
 
 class TestRebalanceValidation:
@@ -145,11 +193,11 @@ class TestRebalanceValidation:
     ])
     def test_valid_rebalance_values(self, validator, valid_rebalance):
         """Test all valid rebalance values."""
-        settings = {"capital": 100000, "rebalance": valid_rebalance, "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(rebalance=valid_rebalance)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Rebalance" in error for error in errors)
+        assert "Rebalance" not in "\n".join(errors)
     
     def test_missing_rebalance(self, validator):
         """Test validation fails when rebalance is missing."""
@@ -157,34 +205,34 @@ class TestRebalanceValidation:
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Rebalance is required" in error for error in errors)
+        assert "Rebalance is required" in "\n".join(errors)
     
     def test_rebalance_none(self, validator):
         """Test validation fails when rebalance is None."""
-        settings = {"capital": 100000, "rebalance": None, "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(rebalance=None)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Rebalance is required" in error for error in errors)
+        assert "Rebalance is required" in "\n".join(errors)
     
     def test_invalid_rebalance_value(self, validator):
         """Test validation fails for invalid rebalance value."""
-        settings = {"capital": 100000, "rebalance": "invalid", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(rebalance="invalid")
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Rebalance must be one of:" in error for error in errors)
+        assert "Rebalance must be one of:" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_rebalance", [
         123, [], {}, True, False
     ])
     def test_rebalance_invalid_types(self, validator, invalid_rebalance):
         """Test validation fails for non-string rebalance types."""
-        settings = {"capital": 100000, "rebalance": invalid_rebalance, "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings(rebalance=invalid_rebalance)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Rebalance must be a string" in error for error in errors)
+        assert "Rebalance must be a string" in "\n".join(errors)
 
 
 class TestDateValidation:
@@ -198,7 +246,7 @@ class TestDateValidation:
         is_valid, errors = validator.validate_settings(settings)
         
         # Should not have date format errors (may have other errors)
-        assert not any("date must be in YYYY-MM-DD format" in error for error in errors)
+        assert "date must be in YYYY-MM-DD format" not in "\n".join(errors)
     
     def test_missing_start_date(self, validator):
         """Test validation fails when start date is missing."""
@@ -206,7 +254,7 @@ class TestDateValidation:
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Start is required" in error for error in errors)
+        assert "Start is required" in "\n".join(errors)
     
     def test_missing_end_date(self, validator):
         """Test validation fails when end date is missing."""
@@ -214,32 +262,34 @@ class TestDateValidation:
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("End is required" in error for error in errors)
+        assert "End is required" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_date", [
-        "2020/01/01", "01-01-2020", "2020-1-1", "2020-13-01", "2020-02-30", "invalid", ""
+        "2020/01/01", "01-01-2020", "2020-1-1", "2020-13-01", "2020-02-30", "invalid", "",
+        "1900-02-29", "2021-04-31", "2020-00-10", "2020-01-00", "+020-01-01", "2020-01-01 ",
+        "20200101", "2020-W01-1", "2020-01-01T00:00", "0000-01-01"
     ])
     def test_invalid_date_formats(self, validator, invalid_date):
         """Test various invalid date formats."""
-        settings = {"capital": 100000, "rebalance": "daily", "start": invalid_date, "end": "2020-12-31"}
+        settings = make_settings(start=invalid_date)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("date must be in YYYY-MM-DD format" in error for error in errors)
+        assert "date must be in YYYY-MM-DD format" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_date_type", [
         123, [], {}, True, None
     ])
     def test_date_invalid_types(self, validator, invalid_date_type):
         """Test validation fails for non-string date types."""
-        settings = {"capital": 100000, "rebalance": "daily", "start": invalid_date_type, "end": "2020-12-31"}
+        settings = make_settings(start=invalid_date_type)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
         if invalid_date_type is None:
-            assert any("Start is required" in error for error in errors)
+            assert "Start is required" in "\n".join(errors)
         else:
-            assert any("Start date must be a string" in error for error in errors)
+            assert "Start date must be a string" in "\n".join(errors)
     
     def test_start_after_end_date(self, validator):
         """Test validation fails when start date is after end date."""
@@ -252,7 +302,7 @@ class TestDateValidation:
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Start date must be on or before end date" in error for error in errors)
+        assert "Start date must be on or before end date" in "\n".join(errors)
     
     def test_start_equals_end_date(self, validator):
         """Test validation passes when start date equals end date."""
@@ -265,7 +315,20 @@ class TestDateValidation:
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Start date must be on or before end date" in error for error in errors)
+        assert "Start date must be on or before end date" not in "\n".join(errors)
+    
+    def test_start_after_end_date_across_months(self, validator):
+        """Test start/end ordering compares year, then month, then day."""
+        settings = {
+            "capital": 100000, 
+            "rebalance": "daily", 
+            "start": "2020-10-01", 
+            "end": "2020-09-30"
+        }
+        is_valid, errors = validator.validate_settings(settings)
+        
+        assert is_valid is False
+        assert "Start date must be on or before end date" in "\n".join(errors)
 
 
 class TestCurrencyValidation:
@@ -275,179 +338,118 @@ class TestCurrencyValidation:
     ])
     def test_valid_currencies(self, validator, valid_currency):
         """Test various valid currency codes."""
-        settings = {
-            "capital": 100000, 
-            "rebalance": "daily", 
-            "start": "2020-01-01", 
-            "end": "2020-12-31",
-            "currency": valid_currency
-        }
+        settings = make_settings(currency=valid_currency)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Currency" in error for error in errors)
+        assert "Currency" not in "\n".join(errors)
     
     def test_currency_optional(self, validator):
         """Test that currency is optional."""
-        settings = {"capital": 100000, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings()
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Currency" in error for error in errors)
+        assert "Currency" not in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_currency", [
-        "usd", "US", "USDX", "12D", "", "U$D"
+        "usd", "US", "USDX", "12D", "", "U$D", "USD\n", "UsD", "ÄÖÜ"
     ])
     def test_invalid_currency_formats(self, validator, invalid_currency):
         """Test various invalid currency formats."""
-        settings = {
-            "capital": 100000, 
-            "rebalance": "daily", 
-            "start": "2020-01-01", 
-            "end": "2020-12-31",
-            "currency": invalid_currency
-        }
+        settings = make_settings(currency=invalid_currency)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Currency must be a 3-letter uppercase code" in error for error in errors)
+        assert "Currency must be a 3-letter uppercase code" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_currency_type", [
         123, [], {}, True
     ])
     def test_currency_invalid_types(self, validator, invalid_currency_type):
         """Test validation fails for non-string currency types."""
-        settings = {
-            "capital": 100000, 
-            "rebalance": "daily", 
-            "start": "2020-01-01", 
-            "end": "2020-12-31",
-            "currency": invalid_currency_type
-        }
+        settings = make_settings(currency=invalid_currency_type)
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Currency must be a string" in error for error in errors)
+        assert "Currency must be a string" in "\n".join(errors)
 
 
 class TestFeesValidation:
     
     def test_valid_fees_complete(self, validator):
         """Test validation with all fee fields."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {
-                "perOrder": 5.0,
-                "perShare": 0.01,
-                "percentage": 0.001
-            }
-        }
+        settings = make_settings(fees={
+            "perOrder": 5.0,
+            "perShare": 0.01,
+            "percentage": 0.001
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Fee" in error for error in errors)
+        assert "Fee" not in "\n".join(errors)
     
     def test_valid_fees_partial(self, validator):
         """Test validation with some fee fields."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {
-                "perOrder": 5.0
-            }
-        }
+        settings = make_settings(fees={
+            "perOrder": 5.0
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Fee" in error for error in errors)
+        assert "Fee" not in "\n".join(errors)
     
     def test_fees_optional(self, validator):
         """Test that fees field is optional."""
-        settings = {"capital": 100000, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings()
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Fees" in error for error in errors)
+        assert "Fees" not in "\n".join(errors)
     
-    def test_fees_not_dict(self, validator):
+    @pytest.mark.parametrize("fees", ["string", 123, [], True])
+    def test_fees_not_dict(self, validator, fees):
         """Test validation fails when fees is not a dictionary."""
-        test_cases = ["string", 123, [], True]
-        
-        for fees in test_cases:
-            settings = {
-                "capital": 100000,
-                "rebalance": "daily",
-                "start": "2020-01-01",
-                "end": "2020-12-31",
-                "fees": fees
-            }
-            is_valid, errors = validator.validate_settings(settings)
-            assert is_valid is False
-            assert any("Fees must be an object/dictionary" in error for error in errors)
+        settings = make_settings(fees=fees)
+        is_valid, errors = validator.validate_settings(settings)
+        
+        assert is_valid is False
+        assert "Fees must be an object/dictionary" in "\n".join(errors)
     
     def test_fees_empty_dict(self, validator):
         """Test validation passes with empty fees dictionary."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {}
-        }
+        settings = make_settings(fees={})
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Fee" in error for error in errors)
+        assert "Fee" not in "\n".join(errors)
     
     @pytest.mark.parametrize("fee_field", ["perOrder", "perShare"])
     def test_valid_fee_fields(self, validator, fee_field):
         """Test valid fee field values."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {fee_field: 5.0}
-        }
+        settings = make_settings(fees={fee_field: 5.0})
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any(f"Fee {fee_field}" in error for error in errors)
+        assert f"Fee {fee_field}" not in "\n".join(errors)
     
     @pytest.mark.parametrize("fee_field", ["perOrder", "perShare"])
     def test_fee_fields_zero_value(self, validator, fee_field):
         """Test fee fields with zero value (should be valid)."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {fee_field: 0}
-        }
+        settings = make_settings(fees={fee_field: 0})
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any(f"Fee {fee_field}" in error for error in errors)
+        assert f"Fee {fee_field}" not in "\n".join(errors)
     
     @pytest.mark.parametrize("fee_field", ["perOrder", "perShare"])
     def test_fee_fields_negative(self, validator, fee_field):
         """Test validation fails for negative fee values."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {fee_field: -1.0}
-        }
+        settings = make_settings(fees={fee_field: -1.0})
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any(f"Fee {fee_field} must be greater than or equal to 0" in error for error in errors)
+        assert f"Fee {fee_field} must be greater than or equal to 0" in "\n".join(errors)
     
     @pytest.mark.parametrize("fee_field,invalid_value", [
         ("perOrder", "5.0"),
@@ -461,80 +463,50 @@ class TestFeesValidation:
     ])
     def test_fee_fields_invalid_types(self, validator, fee_field, invalid_value):
         """Test validation fails for non-numeric fee types."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {fee_field: invalid_value}
-        }
+        settings = make_settings(fees={fee_field: invalid_value})
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any(f"Fee {fee_field} must be a number" in error for error in errors)
+        assert f"Fee {fee_field} must be a number" in "\n".join(errors)
     
     def test_percentage_fee_valid_range(self, validator):
         """Test valid percentage fee values (0 to 1)."""
         valid_percentages = [0, 0.5, 1, 0.001, 0.999]
         
         for percentage in valid_percentages:
-            settings = {
-                "capital": 100000,
-                "rebalance": "daily",
-                "start": "2020-01-01",
-                "end": "2020-12-31",
-                "fees": {"percentage": percentage}
-            }
+            settings = make_settings(fees={"percentage": percentage})
             is_valid, errors = validator.validate_settings(settings)
             
             assert is_valid is True
-            assert not any("Fee percentage" in error for error in errors)
+            assert "Fee percentage" not in "\n".join(errors)
     
     def test_percentage_fee_too_high(self, validator):
         """Test validation fails for percentage fee > 1."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {"percentage": 1.5}
-        }
+        settings = make_settings(fees={"percentage": 1.5})
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Fee percentage must be less than or equal to 1" in error for error in errors)
+        assert "Fee percentage must be less than or equal to 1" in "\n".join(errors)
     
     def test_percentage_fee_negative(self, validator):
         """Test validation fails for negative percentage fee."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {"percentage": -0.1}
-        }
+        settings = make_settings(fees={"percentage": -0.1})
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Fee percentage must be greater than or equal to 0" in error for error in errors)
+        assert "Fee percentage must be greater than or equal to 0" in "\n".join(errors)
     
     def test_fees_unknown_fields(self, validator):
         """Test validation fails for unknown fee fields."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "fees": {
-                "perOrder": 5.0,
-                "unknownField": 10.0,
-                "anotherUnknown": 20.0
-            }
-        }
+        settings = make_settings(fees={
+            "perOrder": 5.0,
+            "unknownField": 10.0,
+            "anotherUnknown": 20.0
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Unknown fee fields:" in error for error in errors)
+        assert "Unknown fee fields:" in "\n".join(errors)
 
 
 class TestSlippageValidation:
@@ -542,152 +514,103 @@ class TestSlippageValidation:
     @pytest.mark.parametrize("valid_model", ["fixed", "percentage", "volumeImpact"])
     def test_valid_slippage_models(self, validator, valid_model):
         """Test all valid slippage models."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "slippage": {
-                "model": valid_model,
-                "value": 0.001
-            }
-        }
+        settings = make_settings(slippage={
+            "model": valid_model,
+            "value": 0.001
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Slippage" in error for error in errors)
+        assert "Slippage" not in "\n".join(errors)
     
     def test_slippage_optional(self, validator):
         """Test that slippage field is optional."""
-        settings = {"capital": 100000, "rebalance": "daily", "start": "2020-01-01", "end": "2020-12-31"}
+        settings = make_settings()
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is True
-        assert not any("Slippage" in error for error in errors)
+        assert "Slippage" not in "\n".join(errors)
     
-    def test_slippage_not_dict(self, validator):
+    @pytest.mark.parametrize("slippage", ["string", 123, [], True])
+    def test_slippage_not_dict(self, validator, slippage):
         """Test validation fails when slippage is not a dictionary."""
-        test_cases = ["string", 123, [], True]
-        
-        for slippage in test_cases:
-            settings = {
-                "capital": 100000,
-                "rebalance": "daily",
-                "start": "2020-01-01",
-                "end": "2020-12-31",
-                "slippage": slippage
-            }
-            is_valid, errors = validator.validate_settings(settings)
-            assert is_valid is False
-            assert any("Slippage must be an object/dictionary" in error for error in errors)
+        settings = make_settings(slippage=slippage)
+        is_valid, errors = validator.validate_settings(settings)
+        
+        assert is_valid is False
+        assert "Slippage must be an object/dictionary" in "\n".join(errors)
     
     def test_invalid_slippage_model(self, validator):
         """Test validation fails for invalid slippage model."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "slippage": {
-                "model": "invalid",
-                "value": 0.001
-            }
-        }
+        settings = make_settings(slippage={
+            "model": "invalid",
+            "value": 0.001
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Slippage model must be one of:" in error for error in errors)
+        assert "Slippage model must be one of:" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_model_type", [123, [], {}, True])
     def test_slippage_model_invalid_types(self, validator, invalid_model_type):
         """Test validation fails for non-string slippage model types."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "slippage": {
-                "model": invalid_model_type,
-                "value": 0.001
-            }
-        }
+        settings = make_settings(slippage={
+            "model": invalid_model_type,
+            "value": 0.001
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Slippage model must be a string" in error for error in errors)
+        assert "Slippage model must be a string" in "\n".join(errors)
     
     def test_valid_slippage_values(self, validator):
         """Test valid slippage value range."""
         valid_values = [0, 0.001, 1.0, 10.5]
         
         for value in valid_values:
-            settings = {
-                "capital": 100000,
-                "rebalance": "daily",
-                "start": "2020-01-01",
-                "end": "2020-12-31",
-                "slippage": {
-                    "model": "fixed",
-                    "value": value
-                }
-            }
+            settings = make_settings(slippage={
+                "model": "fixed",
+                "value": value
+            })
             is_valid, errors = validator.validate_settings(settings)
             
             assert is_valid is True
-            assert not any("Slippage value" in error for error in errors)
+            assert "Slippage value" not in "\n".join(errors)
     
     def test_negative_slippage_value(self, validator):
         """Test validation fails for negative slippage value."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "slippage": {
-                "model": "fixed",
-                "value": -0.001
-            }
-        }
+        settings = make_settings(slippage={
+            "model": "fixed",
+            "value": -0.001
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Slippage value must be greater than or equal to 0" in error for error in errors)
+        assert "Slippage value must be greater than or equal to 0" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_value_type", ["0.001", [], {}, True])
     def test_slippage_value_invalid_types(self, validator, invalid_value_type):
         """Test validation fails for non-numeric slippage value types."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "slippage": {
-                "model": "fixed",
-                "value": invalid_value_type
-            }
-        }
+        settings = make_settings(slippage={
+            "model": "fixed",
+            "value": invalid_value_type
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Slippage value must be a number" in error for error in errors)
+        assert "Slippage value must be a number" in "\n".join(errors)
     
     def test_slippage_unknown_fields(self, validator):
         """Test validation fails for unknown slippage fields."""
-        settings = {
-            "capital": 100000,
-            "rebalance": "daily",
-            "start": "2020-01-01",
-            "end": "2020-12-31",
-            "slippage": {
-                "model": "fixed",
-                "value": 0.001,
-                "unknownField": "unknown"
-            }
-        }
+        settings = make_settings(slippage={
+            "model": "fixed",
+            "value": 0.001,
+            "unknownField": "unknown"
+        })
         is_valid, errors = validator.validate_settings(settings)
         
         assert is_valid is False
-        assert any("Unknown slippage fields:" in error for error in errors)
+        assert "Unknown slippage fields:" in "\n".join(errors)
 
 
 class TestValidateSettingsStructure:
@@ -706,16 +629,15 @@ class TestValidateSettingsStructure:
         is_valid, errors = validator.validate_settings_structure(data)
         
         assert is_valid is False
-        assert any("Settings property is required" in error for error in errors)
+        assert "Settings property is required" in "\n".join(errors)
     
-    def test_data_not_dict(self, validator):
+    @pytest.mark.parametrize("data", [None, [], "string", 123, True])
+    def test_data_not_dict(self, validator, data):
         """Test validation fails when data is not a dictionary."""
-        test_cases = [None, [], "string", 123, True]
+        is_valid, errors = validator.validate_settings_structure(data)
         
-        for data in test_cases:
-            is_valid, errors = validator.validate_settings_structure(data)
-            assert is_valid is False
-            assert any("StrategySpec must be a dictionary/object" in error for error in errors)
+        assert is_valid is False
+        assert "StrategySpec must be a dictionary/object" in "\n".join(errors)
 
 
 class TestGetValidationSummary:
@@ -740,4 +662,120 @@ class TestGetValidationSummary:
         assert summary['is_valid'] is True
         assert summary['error_count'] == 0
         assert summary['required_fields_present']['capital'] is True
-        assert summary['required_fields_present']['rebalance'] is True
\ No newline at end of file
+        assert summary['required_fields_present']['rebalance'] is True
+    
+    def test_validation_summary_field_types(self, validator, minimal_valid_settings):
+        """Test field types are reported by type name."""
+        summary = validator.get_validation_summary(minimal_valid_settings)
+        
+        assert summary['field_types'] == {
+            field: type(value).__name__ for field, value in minimal_valid_settings.items()
+        }
+        assert summary['field_types']['capital'] in ("int", "float")
+        assert summary['field_types']['rebalance'] == "str"
+
+
+class TestErrorCodes:
+    
+    def test_valid_settings_have_no_codes(self, validator, valid_settings):
+        """Test valid settings return an empty error list with no codes."""
+        is_valid, errors = validator.validate_settings(valid_settings)
+        
+        assert is_valid is True
+        assert errors == []
+        assert errors.codes == set()
+    
+    def test_codes_match_errors(self, validator):
+        """Test each error message is recorded with its code."""
+        settings = {
+            "rebalance": "hourly",
+            "start": "2020-02-30",
+            "end": "2020-12-31",
+            "currency": "usd",
+            "fees": {"percentage": 2, "unknown": 1},
+            "slippage": {"model": "fixed", "value": -1}
+        }
+        is_valid, errors = validator.validate_settings(settings)
+        
+        assert is_valid is False
+        assert errors.codes == {
+            "capital_required",
+            "rebalance_invalid",
+            "start_date_format",
+            "currency_format",
+            "fee_percentage_maximum",
+            "fees_unknown_fields",
+            "slippage_value_minimum",
+            "date_format",
+        }
+        assert len(errors) == len(errors.codes)
+    
+    def test_non_dict_settings_code(self, validator):
+        """Test non-dictionary settings report the settings_type code."""
+        is_valid, errors = validator.validate_settings("invalid")
+        
+        assert is_valid is False
+        assert errors == ["Settings must be a dictionary/object"]
+        assert errors.codes == {"settings_type"}
+    
+    def test_validator_has_no_instance_dict(self, validator):
+        """Test the validator and its error list carry no instance __dict__."""
+        is_valid, errors = validator.validate_settings({})
+        
+        assert not hasattr(validator, "__dict__")
+        assert not hasattr(errors, "__dict__")
+    
+    def test_structure_missing_settings_code(self, validator):
+        """Test a spec without settings reports the settings_required code."""
+        is_valid, errors = validator.validate_settings_structure({"meta": {}})
+        
+        assert is_valid is False
+        assert "settings_required" in errors.codes
+
+
+class TestResultCache:
+    
+    def test_repeated_calls_return_independent_lists(self, validator):
+        """Test cached results are copied so callers can't alter later results."""
+        settings = make_settings(capital=-1)
+        _, first_errors = validator.validate_settings(settings)
+        first_errors.append("modified")
+        first_errors.codes.add("modified")
+        
+        is_valid, errors = validator.validate_settings(make_settings(capital=-1))
+        
+        assert is_valid is False
+        assert errors == ["Capital must be greater than or equal to 0"]
+        assert errors.codes == {"capital_minimum"}
+    
+    def test_key_order_does_not_change_result(self, validator):
+        """Test settings with the same content in a different order validate the same."""
+        settings = make_settings(fees={"unknownB": 1, "unknownA": 2})
+        reordered = dict(reversed(list(settings.items())))
+        
+        assert validator.validate_settings(settings) == validator.validate_settings(reordered)
+    
+    def test_non_json_settings_validated_directly(self, validator):
+        """Test settings that can't be serialized to JSON are still validated."""
+        is_valid, errors = validator.validate_settings(make_settings(currency={"USD"}))
+        
+        assert is_valid is False
+        assert errors == ["Currency must be a string"]
+        assert errors.codes == {"currency_type"}
+    
+    def test_cache_miss_validates_caller_object(self):
+        """Test a cache miss validates the settings object that was passed in, not a JSON copy."""
+        seen = []
+        
+        class RecordingValidator(SettingsValidator):
+            __slots__ = ()
+            
+            def _check_settings(self, settings):
+                seen.append(settings)
+                return super()._check_settings(settings)
+        
+        settings = make_settings(capital=98765.25)
+        is_valid, errors = RecordingValidator().validate_settings(settings)
+        
+        assert is_valid is True
+        assert len(seen) == 1 and seen[0] is settings
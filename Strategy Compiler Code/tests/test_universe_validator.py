@@ -2,14 +2,20 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
+from validators import default_universe_validator
 from validators.universe_validator import UniverseValidator
 
 
+# Minimal valid asset shared by tests; read-only so no test can alter it
+_BASE_ASSET = MappingProxyType({"symbol": "AAPL"})
+
+
 # Global fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validator():
-    """Create a fresh UniverseValidator instance for each test."""
-    return UniverseValidator()
+    """Shared stateless UniverseValidator instance."""
+    return default_universe_validator
 
 @pytest.fixture
 def valid_universe():
@@ -40,14 +46,6 @@ def minimal_valid_universe():
         {"symbol": "TQQQ"}
     ]
 
-@pytest.fixture
-def temp_sample_dir(tmp_path):
-    """Create a temporary directory structure with sample files."""
-    sample_dir = tmp_path / "sample_inputs"
-    strategy_dir = sample_dir / "test_strategy"
-    strategy_dir.mkdir(parents=True)
-    return sample_dir
-
 
 class TestValidateUniverseProperty:
     
@@ -67,34 +65,45 @@ class TestValidateUniverseProperty:
         assert errors == []
         assert len(warnings) == 0
     
-    def test_universe_not_list(self, validator):
+    @pytest.mark.parametrize("universe", [None, {}, "string", 123, True])
+    def test_universe_not_list(self, validator, universe):
         """Test validation fails when universe is not a list."""
-        test_cases = [None, {}, "string", 123, True]
+        is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
-        for universe in test_cases:
-            is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
-            assert is_valid is False
-            assert any("Universe must be an array" in error for error in errors)
+        assert is_valid is False
+        assert "Universe must be an array" in "\n".join(errors)
     
     def test_universe_empty_list(self, validator):
         """Test validation fails for empty universe."""
         is_valid, errors, warnings = validator.validate_universe_property([], "test.json")
         
         assert is_valid is False
-        assert any("Universe must contain at least one asset" in error for error in errors)
+        assert "Universe must contain at least one asset" in "\n".join(errors)
+    
+    def test_results_not_shared_between_calls(self, validator, minimal_valid_universe):
+        """Test that a reused validator returns independent results per call."""
+        _, first_errors, first_warnings = validator.validate_universe_property(
+            [{"symbol": 1, "extra": True}], "test.json"
+        )
+        is_valid, errors, warnings = validator.validate_universe_property(minimal_valid_universe)
+        
+        assert is_valid is True
+        assert errors == []
+        assert warnings == []
+        assert len(first_errors) == 1
+        assert len(first_warnings) == 1
 
 
 class TestAssetValidation:
     
-    def test_asset_not_dict(self, validator):
+    @pytest.mark.parametrize("asset", [None, [], "SPY", 123, True])
+    def test_asset_not_dict(self, validator, asset):
         """Test validation fails when asset is not a dictionary."""
-        test_cases = [None, [], "SPY", 123, True]
+        universe = [asset]
+        is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
-        for asset in test_cases:
-            universe = [asset]
-            is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
-            assert is_valid is False
-            assert any("Asset must be an object" in error for error in errors)
+        assert is_valid is False
+        assert "Asset must be an object" in "\n".join(errors)
     
     def test_asset_missing_symbol(self, validator):
         """Test validation fails when symbol is missing."""
@@ -102,7 +111,7 @@ class TestAssetValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
         assert is_valid is False
-        assert any("Missing required field 'symbol'" in error for error in errors)
+        assert "Missing required field 'symbol'" in "\n".join(errors)
     
     def test_asset_with_all_fields(self, validator):
         """Test validation passes with all valid fields."""
@@ -120,7 +129,7 @@ class TestAssetValidation:
 class TestSymbolValidation:
     
     @pytest.mark.parametrize("valid_symbol", [
-        "SPY", "AAPL", "TQQQ", "BRK.B", "BTC-USD", "ES:DEC23", "A1B2C3", "X"
+        "SPY", "AAPL", "TQQQ", "BRK.B", "BTC-USD", "ES:DEC23", "A1B2C3", "X", "btc/usd", "A" * 20
     ])
     def test_valid_symbols(self, validator, valid_symbol):
         """Test various valid symbol formats."""
@@ -130,15 +139,14 @@ class TestSymbolValidation:
         assert is_valid is True
         assert not any("symbol" in error and "does not match required pattern" in error for error in errors)
     
-    def test_symbol_not_string(self, validator):
+    @pytest.mark.parametrize("symbol", [123, [], {}, True, None])
+    def test_symbol_not_string(self, validator, symbol):
         """Test validation fails for non-string symbol."""
-        test_cases = [123, [], {}, True, None]
+        universe = [{"symbol": symbol}]
+        is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
-        for symbol in test_cases:
-            universe = [{"symbol": symbol}]
-            is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
-            assert is_valid is False
-            assert any("symbol must be a string" in error for error in errors)
+        assert is_valid is False
+        assert "symbol must be a string" in "\n".join(errors)
     
     def test_symbol_empty_string(self, validator):
         """Test validation fails for empty symbol."""
@@ -146,7 +154,7 @@ class TestSymbolValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
         assert is_valid is False
-        assert any("symbol cannot be empty" in error for error in errors)
+        assert "symbol cannot be empty" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_symbol", [
         "A" * 21,  # Too long
@@ -155,6 +163,8 @@ class TestSymbolValidation:
         "TEST#",   # Hash not allowed
         "SYM%",    # Percent not allowed
         "A&B",     # Ampersand not allowed
+        "SPY\n",   # Trailing newline not allowed
+        "ÄPPL",    # Non-ASCII letter not allowed
     ])
     def test_invalid_symbol_patterns(self, validator, invalid_symbol):
         """Test validation fails for invalid symbol patterns."""
@@ -162,7 +172,7 @@ class TestSymbolValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
         assert is_valid is False
-        assert any("does not match required pattern" in error for error in errors)
+        assert "does not match required pattern" in "\n".join(errors)
     
     def test_duplicate_symbols_warning(self, validator):
         """Test warning for duplicate symbols."""
@@ -175,7 +185,36 @@ class TestSymbolValidation:
         
         assert is_valid is True
         assert errors == []
-        assert any("Duplicate symbol 'SPY' found" in warning for warning in warnings)
+        assert "Duplicate symbol 'SPY' found" in "\n".join(warnings)
+    
+    def test_duplicate_symbols_warn_once_per_repeat(self, validator):
+        """Test each repeated occurrence of a symbol gets its own warning."""
+        universe = [{"symbol": "SPY"}, {"symbol": "QQQ"}, {"symbol": "SPY"}, {"symbol": "SPY"}]
+        is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
+        
+        assert is_valid is True
+        assert warnings == [
+            "test.json[2]: Duplicate symbol 'SPY' found in universe",
+            "test.json[3]: Duplicate symbol 'SPY' found in universe"
+        ]
+    
+    def test_duplicate_detection_scales_to_large_universe(self, validator):
+        """Test duplicate detection over a large universe with one repeat."""
+        universe = [{"symbol": f"S{i}"} for i in range(10000)]
+        universe.append({"symbol": "S0"})
+        is_valid, errors, warnings = validator.validate_universe_property(universe)
+        
+        assert is_valid is True
+        assert warnings == ["asset[10000]: Duplicate symbol 'S0' found in universe"]
+    
+    def test_duplicate_warnings_follow_asset_order(self, validator):
+        """Test duplicate warnings are reported in place among other asset warnings."""
+        universe = [{"symbol": "SPY"}, {"symbol": "SPY", "sector": "Index"}, {"symbol": "QQQ", "extra": 1}]
+        is_valid, errors, warnings = validator.validate_universe_property(universe)
+        
+        assert is_valid is True
+        assert [w.split(":")[0] for w in warnings] == ["asset[1]", "asset[1]", "asset[2]"]
+        assert "Duplicate symbol 'SPY'" in warnings[0]
     
     def test_symbol_max_length(self, validator):
         """Test symbol at maximum allowed length."""
@@ -183,7 +222,7 @@ class TestSymbolValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("does not match required pattern" in error for error in errors)
+        assert "does not match required pattern" not in "\n".join(errors)
 
 
 class TestNameValidation:
@@ -194,7 +233,7 @@ class TestNameValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("name" in error for error in errors)
+        assert "name" not in "\n".join(errors)
     
     def test_name_optional(self, validator):
         """Test that name field is optional."""
@@ -202,7 +241,7 @@ class TestNameValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("name" in error for error in errors)
+        assert "name" not in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_name", [123, [], {}, True])
     def test_name_invalid_types(self, validator, invalid_name):
@@ -211,7 +250,7 @@ class TestNameValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
         assert is_valid is False
-        assert any("name must be a string" in error for error in errors)
+        assert "name must be a string" in "\n".join(errors)
     
     def test_name_none_allowed(self, validator):
         """Test that None name is allowed."""
@@ -219,7 +258,7 @@ class TestNameValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("name must be a string" in error for error in errors)
+        assert "name must be a string" not in "\n".join(errors)
     
     def test_name_empty_string_allowed(self, validator):
         """Test that empty string name is allowed."""
@@ -227,7 +266,7 @@ class TestNameValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("name" in error for error in errors)
+        assert "name" not in "\n".join(errors)
 
 
 class TestAssetClassValidation:
@@ -241,7 +280,7 @@ class TestAssetClassValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("assetClass" in error for error in errors)
+        assert "assetClass" not in "\n".join(errors)
     
     def test_asset_class_optional(self, validator):
         """Test that assetClass is optional."""
@@ -249,43 +288,42 @@ class TestAssetClassValidation:
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("assetClass" in error for error in errors)
+        assert "assetClass" not in "\n".join(errors)
     
     def test_asset_class_invalid_value(self, validator):
         """Test validation fails for invalid asset class."""
-        universe = [{"symbol": "AAPL", "assetClass": "STOCK"}]
+        universe = [{**_BASE_ASSET, "assetClass": "STOCK"}]
         is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
         assert is_valid is False
-        assert any("assetClass 'STOCK' is not valid" in error for error in errors)
-        assert any("Valid options:" in error for error in errors)
+        assert "assetClass 'STOCK' is not valid" in "\n".join(errors)
+        assert "Valid options:" in "\n".join(errors)
     
     @pytest.mark.parametrize("invalid_asset_class", [123, [], {}, True])
     def test_asset_class_invalid_types(self, validator, invalid_asset_class):
         """Test validation fails for non-string asset class types."""
-        universe = [{"symbol": "AAPL", "assetClass": invalid_asset_class}]
+        universe = [{**_BASE_ASSET, "assetClass": invalid_asset_class}]
         is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
         assert is_valid is False
-        assert any("assetClass must be a string" in error for error in errors)
+        assert "assetClass must be a string" in "\n".join(errors)
     
     def test_asset_class_none_allowed(self, validator):
         """Test that None asset class is allowed."""
-        universe = [{"symbol": "AAPL", "assetClass": None}]
+        universe = [{**_BASE_ASSET, "assetClass": None}]
         is_valid, errors, warnings = validator.validate_universe_property(universe)
         
         assert is_valid is True
-        assert not any("assetClass" in error for error in errors)
+        assert "assetClass" not in "\n".join(errors)
     
-    def test_asset_class_case_sensitive(self, validator):
+    @pytest.mark.parametrize("asset_class", ["equity", "etf", "Equity", "Etf"])
+    def test_asset_class_case_sensitive(self, validator, asset_class):
         """Test that asset class validation is case sensitive."""
-        test_cases = ["equity", "etf", "Equity", "Etf"]
+        universe = [{**_BASE_ASSET, "assetClass": asset_class}]
+        is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
         
-        for asset_class in test_cases:
-            universe = [{"symbol": "AAPL", "assetClass": asset_class}]
-            is_valid, errors, warnings = validator.validate_universe_property(universe, "test.json")
-            assert is_valid is False
-            assert any(f"assetClass '{asset_class}' is not valid" in error for error in errors)
+        assert is_valid is False
+        assert f"assetClass '{asset_class}' is not valid" in "\n".join(errors)
 
 
 class TestAdditionalProperties:
@@ -366,7 +404,7 @@ class TestValidateSampleFiles:
         file_path = str(spec_file)
         is_valid, errors, warnings = results[file_path]
         assert is_valid is False
-        assert any("JSON decode error" in error for error in errors)
+        assert "JSON decode error" in "\n".join(errors)
     
     def test_validate_sample_files_no_universe(self, validator, temp_sample_dir):
         """Test handling of files without universe property."""
@@ -381,7 +419,7 @@ class TestValidateSampleFiles:
         file_path = str(spec_file)
         is_valid, errors, warnings = results[file_path]
         assert is_valid is False
-        assert any("No 'universe' property found" in error for error in errors)
+        assert "No 'universe' property found" in "\n".join(errors)
     
     def test_validate_sample_files_nonexistent_directory(self, validator):
         """Test handling of nonexistent directory."""
@@ -412,6 +450,42 @@ class TestValidateSampleFiles:
             assert is_valid is True
             assert errors == []
 
+    def test_validate_sample_files_multiple_files_mixed(self, validator, temp_sample_dir):
+        """Test each file keeps its own result when several are validated together."""
+        contents = {
+            "spec_valid.json": json.dumps({"universe": [{"symbol": "SPY"}]}),
+            "spec_bad_json.json": "{ invalid json",
+            "spec_no_universe.json": json.dumps({"meta": {"name": "Test"}}),
+        }
+        expected_paths = {}
+        for i, (file_name, text) in enumerate(contents.items()):
+            strategy_dir = temp_sample_dir / f"strategy_{i}"
+            strategy_dir.mkdir()
+            spec_file = strategy_dir / file_name
+            spec_file.write_text(text)
+            expected_paths[file_name] = str(spec_file)
+        
+        results = validator.validate_sample_files(str(temp_sample_dir))
+        
+        assert set(results) == set(expected_paths.values())
+        assert results[expected_paths["spec_valid.json"]] == (True, [], [])
+        assert "JSON decode error" in results[expected_paths["spec_bad_json.json"]][1][0]
+        assert results[expected_paths["spec_no_universe.json"]] == (False, ["No 'universe' property found"], [])
+    
+    def test_validate_sample_files_on_process_pool(self, validator, temp_sample_dir):
+        """Test validating on worker processes gives the same results as threads."""
+        for i in range(4):
+            strategy_dir = temp_sample_dir / f"strategy_{i}"
+            strategy_dir.mkdir()
+            universe = [{"symbol": f"SYM{i}"}] if i % 2 else [{"symbol": ""}]
+            (strategy_dir / f"spec_{i}.json").write_text(json.dumps({"universe": universe}))
+        
+        thread_results = validator.validate_sample_files(str(temp_sample_dir))
+        process_results = validator.validate_sample_files(str(temp_sample_dir), use_processes=True)
+        
+        assert len(process_results) == 4
+        assert process_results == thread_results
+
 
 class TestGenerateValidationReport:
     
@@ -456,6 +530,28 @@ class TestGenerateValidationReport:
         assert "Total files validated: 0" in report
         assert "Valid files: 0" in report
         assert "Invalid files: 0" in report
+    
+    def test_generate_validation_report_layout(self, validator):
+        """Test the exact report lines, with path prefixes stripped from messages."""
+        results = {
+            "/data/strategy/spec_a.json": (False, ["/data/strategy/spec_a.json[0]: symbol cannot be empty", "Plain error"], ["asset[1]: Duplicate symbol 'SPY' found in universe"]),
+        }
+        report = validator.generate_validation_report(results)
+        
+        assert report.split("\n") == [
+            "Universe Property Validation Report",
+            "=" * 38,
+            "",
+            "Total files validated: 1",
+            "Valid files: 0",
+            "Invalid files: 1",
+            "",
+            "[INVALID]: spec_a.json",
+            "  ERROR: symbol cannot be empty",
+            "  ERROR: Plain error",
+            "  WARNING: Duplicate symbol 'SPY' found in universe",
+            "",
+        ]
 
 
 class TestValidatorConstants:
@@ -467,6 +563,13 @@ class TestValidatorConstants:
         }
         assert validator.VALID_ASSET_CLASSES == expected_classes
     
+    def test_constants_are_class_level_frozensets(self, validator):
+        """Test that lookup constants are immutable and shared by the class."""
+        assert isinstance(UniverseValidator.VALID_ASSET_CLASSES, frozenset)
+        assert isinstance(UniverseValidator.ASSET_PROPERTIES, frozenset)
+        assert isinstance(UniverseValidator.COMMON_ADDITIONAL_PROPERTIES, frozenset)
+        assert validator.ASSET_CLASS_OPTIONS == "BOND, COMMODITY, CRYPTO, EQUITY, ETF, FOREX, FUTURE, OPTION"
+    
     def test_symbol_pattern_constant(self, validator):
         """Test SYMBOL_PATTERN regex."""
         valid_symbols = ["SPY", "AAPL", "BRK.B", "BTC-USD", "ES:DEC23", "A1B2C3"]
@@ -478,6 +581,15 @@ class TestValidatorConstants:
         for symbol in invalid_symbols:
             assert validator.SYMBOL_PATTERN.match(symbol) is None
 
+    def test_symbol_chars_agree_with_pattern(self, validator):
+        """Test the character-set symbol check accepts exactly what SYMBOL_PATTERN does."""
+        samples = [chr(c) * n for c in range(0x20, 0x180) for n in (1, 20, 21)]
+        samples += ["BRK.B", "BTC-USD", "ES:DEC23", "SPY\n", "SPY ", "SÉ"]
+        
+        for symbol in samples:
+            is_valid, errors, warnings = validator.validate_universe_property([{"symbol": symbol}])
+            assert is_valid is (validator.SYMBOL_PATTERN.match(symbol) is not None), repr(symbol)
+
 
 class TestIntegration:
     
@@ -557,9 +669,9 @@ class TestIntegration:
         
         # Should have warnings for additional properties and duplicate
         assert len(warnings) >= 3
-        assert any("Duplicate symbol 'SPY'" in warning for warning in warnings)
-        assert any("common but not in schema" in warning for warning in warnings)
-        assert any("Unexpected additional property" in warning for warning in warnings)
+        assert "Duplicate symbol 'SPY'" in "\n".join(warnings)
+        assert "common but not in schema" in "\n".join(warnings)
+        assert "Unexpected additional property" in "\n".join(warnings)
     
     def test_edge_cases(self, validator):
         """Test various edge cases."""
@@ -0,0 +1,18 @@
+"""
+Validators Package for the Strategy Compiler
+
+This package contains the validators for each section of a StrategySpec JSON
+file. The validators keep no per-call state, so a single shared instance of
+each can be reused for any number of validations.
+"""
+
+from validators.logic_validator import LogicValidator, StrategyValidationError
+from validators.meta_validator import MetaValidator
+from validators.settings_validator import SettingsValidator
+from validators.universe_validator import UniverseValidator
+
+# Shared validator instances
+default_logic_validator = LogicValidator()
+default_meta_validator = MetaValidator()
+default_settings_validator = SettingsValidator()
+default_universe_validator = UniverseValidator()
@@ -1,8 +1,166 @@
 from typing import Dict, Iterable, Set
-from typing import Any, Dict, Iterable, Optional, Set, List, Tuple
-import sys
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Set, List, Tuple
+from functools import lru_cache, partial
+from operator import methodcaller
 
-_CONDITION_OPS = {"gt","gte","lt","lte","eq","neq","crosses_above","crosses_below"}
+_CONDITION_OPS: FrozenSet[str] = frozenset({"gt","gte","lt","lte","eq","neq","crosses_above","crosses_below"})
+
+# Allowed values checked on every node, built once at import
+_ORDER_SIDES: FrozenSet[str] = frozenset({"long", "short"})
+_ORDER_SIZE_TYPES: FrozenSet[str] = frozenset({"percent_equity", "fixed_qty", "fixed_value", "risk_based"})
+_ORDER_ALLOCATIONS: FrozenSet[str] = frozenset({"equal", "weighted", "custom"})
+_CROSS_OPS: FrozenSet[str] = frozenset({"crosses_above", "crosses_below"})
+_COMPARISON_OPS: FrozenSet[str] = frozenset({"gt", "gte", "lt", "lte", "eq", "neq"})
+_FILTER_SELECTS: FrozenSet[str] = frozenset({"top", "bottom", "middle"})
+_WEIGHT_ALLOCATION_METHODS: FrozenSet[str] = frozenset({"explicit_weights", "inverse_volatility"})
+_CONDITION_PERIOD_METRICS: FrozenSet[str] = frozenset({"moving-average-price", "rsi"})
+
+
+# Normalizers for the allowed lists; module-level so they can key the cache
+def _str_upper(value: Any) -> str:
+    return str(value).upper()
+
+
+def _strip_upper(value: str) -> str:
+    return value.strip().upper()
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+_lower = methodcaller("lower")
+_upper = methodcaller("upper")
+
+
+@lru_cache(maxsize=128)
+def _cached_normalized_set(values: Tuple[Any, ...], normalize: Callable[[Any], Any]) -> FrozenSet[Any]:
+    """Set of normalized values, cached per distinct values tuple and normalizer."""
+    return frozenset(map(normalize, values))
+
+
+def _normalized_set(values: Iterable[Any], normalize: Callable[[Any], Any]) -> FrozenSet[Any]:
+    """
+    Set of the allowed symbols or metrics after normalizing each one.
+
+    The same allowed lists are passed for every node of a strategy, so each
+    set is built once and reused.
+    """
+    values = tuple(values)
+    try:
+        return _cached_normalized_set(values, normalize)
+    except TypeError:
+        # Unhashable entries can't key the cache
+        return frozenset(map(normalize, values))
+
+
+def _allowed_symbol_set(symbols: Iterable[Any]) -> FrozenSet[str]:
+    """Uppercased set of allowed symbols."""
+    return _normalized_set(symbols, _str_upper)
+
+
+# ---- condition node helpers ----
+# Module-level rather than redefined as closures on every condition node
+def _is_number(x: Any) -> bool:
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def _validate_condition_metric(
+    m: Any,
+    side: str,
+    node_id: Any,
+    errors: List[str],
+    allowed_metrics_set: Optional[FrozenSet[str]],
+    allowed_symbols_set: Optional[FrozenSet[str]],
+    require_symbol_for_metrics: bool,
+) -> Tuple[Optional[Dict[str, Any]], None]:
+    if not isinstance(m, dict):
+        errors.append(f"For condition '{node_id}', {side}: metric operand must be an object")
+        return None, None
+    name = m.get("name")
+    if not isinstance(name, str) or not name.strip():
+        errors.append(f"For condition '{node_id}', {side}: metric.name must be a non-empty string")
+        return None, None
+    lname = name.strip().lower()
+
+    if allowed_metrics_set is not None and lname not in allowed_metrics_set:
+        errors.append(f"For condition '{node_id}', {side}: metric.name '{name}' is not in allowed_metrics")
+
+    args = m.get("args", {})
+    if args is None:
+        args = {}
+    if not isinstance(args, dict):
+        errors.append(f"For condition '{node_id}', {side}: metric.args must be a dict when provided")
+        args = {}
+
+    sym = m.get("symbol")
+    sym_norm = None
+    if require_symbol_for_metrics:
+        if not isinstance(sym, str) or not sym.strip():
+            errors.append(f"For condition '{node_id}', {side}: metric.symbol is required and must be a non-empty string")
+        else:
+            sym_norm = sym.strip().upper()
+    elif isinstance(sym, str) and sym.strip():
+        sym_norm = sym.strip().upper()
+
+    if allowed_symbols_set is not None and sym_norm is not None and sym_norm not in allowed_symbols_set:
+        errors.append(f"For condition '{node_id}', {side}: symbol '{sym_norm}' is not in allowed_symbols")
+
+    # minimal metric-specific checks (extend as needed)
+    if lname in _CONDITION_PERIOD_METRICS:
+        period = args.get("period")
+        if not isinstance(period, int) or period <= 0:
+            errors.append(f"For condition '{node_id}', {side}: metric '{name}' requires args.period as positive int")
+
+    return {"kind": "metric", "name": name, "args": args, "symbol": sym_norm}, None
+
+
+def _parse_condition_operand(
+    x: Any,
+    side: str,
+    node_id: Any,
+    errors: List[str],
+    allowed_metrics_set: Optional[FrozenSet[str]],
+    allowed_symbols_set: Optional[FrozenSet[str]],
+    require_symbol_for_metrics: bool,
+) -> Dict[str, Any]:
+    # metric object?
+    if isinstance(x, dict) and "name" in x:
+        parsed, _ = _validate_condition_metric(x, side, node_id, errors, allowed_metrics_set, allowed_symbols_set, require_symbol_for_metrics)
+        if parsed is None:
+            return {"kind": "invalid"}
+        return parsed
+    # numeric literal?
+    if _is_number(x):
+        return {"kind": "literal", "value": float(x)}
+    errors.append(f"For condition '{node_id}', {side}: operand must be a metric object or a numeric literal")
+    return {"kind": "invalid"}
+
+
+
+def _else_group_indexes(children: List[Any], label_norm: str) -> List[int]:
+    """Indexes of the direct children that are groups labeled as the Else branch."""
+    else_idxs: List[int] = []
+    for i, c in enumerate(children):
+        if type(c) is dict or isinstance(c, dict):
+            if c.get("type") == "group":
+                d = c.get("description")
+                if isinstance(d, str) and d.strip().lower() == label_norm:
+                    else_idxs.append(i)
+    return else_idxs
+
+def _child_nodes(children_data: Any) -> List[Dict[str, Any]]:
+    """The dict nodes of a 'children' value, which is a list of nodes or a single node."""
+    if isinstance(children_data, list):
+        return [item for item in children_data if isinstance(item, dict)]
+    if isinstance(children_data, dict):
+        return [children_data]
+    return []
+
+# Error messages listing the allowed values, built once at import
+_CONDITION_OPS_MSG = f"condition.operator must be one of {sorted(_CONDITION_OPS)}"
+_ORDER_ALLOCATIONS_MSG = "order.allocation must be one of: equal, weighted, custom"
+_WEIGHT_ALLOCATION_METHODS_MSG = "Weight node allocation_method must be one of: explicit_weights, inverse_volatility"
 
 
 allowed_metrics = [
@@ -31,22 +189,37 @@ allowed_metrics = [
 allowed_symbols = ["TQQQ","SQQQ","BSV","SPY"]
 
 # Defaults (hyphenated)
-DEFAULT_ALLOWED_METRICS: Set[str] = set(allowed_metrics)
+DEFAULT_ALLOWED_METRICS: FrozenSet[str] = frozenset(allowed_metrics)
 
 
 # All node types allowed by your schema
-_SCHEMA_NODE_TYPES: Set[str] = {
+_SCHEMA_NODE_TYPES: FrozenSet[str] = frozenset({
     "group", "condition", "filter", "order", "exit", "expression", "weight"
-}
+})
+
+# Sorted once for the "not allowed here" message
+_SORTED_SCHEMA_NODE_TYPES: List[str] = sorted(_SCHEMA_NODE_TYPES)
 
 
 # Metrics that typically require a positive integer 'period' in args
-METRICS_REQUIRE_PERIOD: Set[str] = {
+METRICS_REQUIRE_PERIOD: FrozenSet[str] = frozenset({
     "sma", "ema", "rsi",
     "moving-avg-price", "moving-avg-return",
     "std-dev-price", "std-dev-return",
     "volatility", "returns", "drawdown",
-}
+})
+
+class StrategyValidationError(Exception):
+    """
+    Raised when the logic of a strategy fails validation.
+
+    Attributes:
+        errors (List[str]): Validation error messages
+    """
+
+    def __init__(self, errors: List[str]):
+        super().__init__("\n".join(errors))
+        self.errors = list(errors)
 
 class LogicValidator:
 
@@ -98,13 +271,13 @@ class LogicValidator:
 
             side = ""            
         
-        if side not in {"long", "short"}:
+        if side not in _ORDER_SIDES:
             error_lines.append(f"For order '{node_id}', order.side must be 'long' or 'short'")
             
         size_type = node.get("size_type", "percent_equity")        
     
         
-        if size_type not in {"percent_equity", "fixed_qty", "fixed_value", "risk_based"}:
+        if size_type not in _ORDER_SIZE_TYPES:
             error_lines.append(f"For order '{node_id}', order.size_type must be one of: percent_equity, fixed_qty, fixed_value, risk_based")
 
         allocation = node.get("allocation", "equal")
@@ -115,8 +288,8 @@ class LogicValidator:
 
             allocation = ""
         
-        if allocation not in {"equal", "weighted", "custom"}:
-            error_lines.append(f"For order '{node_id}', order.allocation must be one of: equal, weighted, custom")
+        if allocation not in _ORDER_ALLOCATIONS:
+            error_lines.append(f"For order '{node_id}', {_ORDER_ALLOCATIONS_MSG}")
 
         # size is generally required except for some risk models; enforce when present
         if "size" in node and not isinstance(node["size"], (int, float)):
@@ -134,8 +307,11 @@ class LogicValidator:
         # Symbols may come from weights keys, or a single symbol_filter, or a universe array.
         symbols = set()  # type: Set[str]
 
-        if weights:
-            symbols |= {str(s).upper() for s in weights.keys()}
+        # Normalize weight keys once; reused by the missing-weight and coercion checks
+        weight_keys = list(map(_str_upper, weights))
+        weight_items = list(zip(weight_keys, weights.values()))
+        weight_symbols = set(weight_keys)
+        symbols |= weight_symbols
 
         symbol_filter = node.get("symbol_filter")
         if symbol_filter:
@@ -147,7 +323,7 @@ class LogicValidator:
         if universe:
             if not isinstance(universe, list) or not all(isinstance(s, str) for s in universe):
                 error_lines.append("For order '{node_id}', order.universe must be an array of strings when provided")
-            symbols |= {s.upper() for s in universe}
+            symbols.update(map(_upper, universe))
 
         if not symbols:
             error_lines.append("For order '{node_id}', No symbols found: provide at least one via weights, symbol_filter, or universe")
@@ -155,36 +331,42 @@ class LogicValidator:
         
 
         # --- Allowed tickers check ---
-        allowed = {str(s).upper() for s in allowed_tickers}
-        invalid = sorted(sym for sym in symbols if sym not in allowed)
+        allowed = _allowed_symbol_set(allowed_tickers)
+        invalid = [sym for sym in symbols if sym not in allowed]
         if invalid:
+            # Only sorted when there is something to report
+            invalid.sort()
             error_lines.append(f"For order '{node_id}', Symbols not allowed: {', '.join(invalid)}")
 
         # --- Weight requirements ---
         # Requirement from spec: for every symbol provided there should be a weight.
         # So we require explicit weights for ALL referenced symbols (even if symbol_filter/universe used).
-        missing_weights = [sym for sym in symbols if sym not in {k.upper() for k in weights.keys()}]
+        missing_weights = [sym for sym in symbols if sym not in weight_symbols]
         if missing_weights:
             error_lines.append(f"For order '{node_id}', Missing weight(s) for: {', '.join(sorted(missing_weights))}")
 
         # Coerce weights to floats; validate non-negativity
         norm_weights: Dict[str, float] = {}
-        for k, v in weights.items():
-            sym = str(k).upper()
+        for sym, v in weight_items:
             if sym not in symbols:
                 # If someone passed an extra weight for a symbol not referenced elsewhere, forbid it
                 error_lines.append(f"For order '{node_id}', Unexpected weight for symbol not referenced by node: {sym}")
-            try:
+            if isinstance(v, (list, dict, bool)):
                 
-                if isinstance(v, list) or isinstance(v, dict) or isinstance(v, bool):
-                    
+                error_lines.append(f"For order '{node_id}', Weight for {sym} must be a number")
+                
+                continue
+            
+            # Weights are usually floats already; only convert anything else
+            if type(v) is float:
+                w = v
+            else:
+                try:
+                    w = float(v)
+                except (TypeError, ValueError, OverflowError):
                     error_lines.append(f"For order '{node_id}', Weight for {sym} must be a number")
-                    
                     continue
-                
-                w = float(v)
-            except Exception:
-                error_lines.append(f"For order '{node_id}', Weight for {sym} must be a number")
+            
             if w < 0:
                 error_lines.append(f"For order '{node_id}', Weight for {sym} must be >= 0")
             norm_weights[sym] = w
@@ -243,7 +425,6 @@ class LogicValidator:
         if node.get("type") != "group":
             error_lines.append("For order '{node_id}', node.type must be 'group'")
 
-        node_id = node.get("id")
         if node_id is not None and not isinstance(node_id, str):
             error_lines.append("For order '{node_id}', group.id must be a string when provided")
 
@@ -269,10 +450,17 @@ class LogicValidator:
             # if not required and absent, normalize to empty list
             error_lines.append("For order '{node_id}', group.children must be an array if present")
 
-        allowed_types: Set[str] = _SCHEMA_NODE_TYPES
+        allowed_types: FrozenSet[str] = _SCHEMA_NODE_TYPES
 
         child_types: List[str] = []
         for idx, child in enumerate(children):
+            # Common case: a plain dict child with an allowed type string
+            if type(child) is dict:
+                ctype = child.get("type")
+                if type(ctype) is str and ctype in allowed_types:
+                    child_types.append(ctype)
+                    continue
+            
             if not isinstance(child, dict):
                 error_lines.append(f"For order '{node_id}', group.child[{idx}] must be an object")
             ctype = child.get("type")
@@ -281,7 +469,7 @@ class LogicValidator:
 
             if ctype not in allowed_types:
                 error_lines.append(
-                    f"For order '{node_id}', group.child[{idx}].type '{ctype}' is not allowed here (allowed: {sorted(allowed_types)})"
+                    f"For order '{node_id}', group.child[{idx}].type '{ctype}' is not allowed here (allowed: {_SORTED_SCHEMA_NODE_TYPES})"
                     )
                 
             child_types.append(ctype)
@@ -327,16 +515,32 @@ class LogicValidator:
             }
         }
         """
-        errors: List[str] = []
+        if not isinstance(node, dict):
+            return False, ["condition node must be a dict"]
 
-        def _fail(msg: str) -> Dict[str, Any]:
-            errors.append(msg)
-            return {"ok": False, "errors": errors}
+        allowed_metrics_set: Optional[FrozenSet[str]] = _normalized_set(allowed_metrics, _lower) if allowed_metrics else None
+        allowed_symbols_set: Optional[FrozenSet[str]] = _normalized_set(allowed_symbols, _upper) if allowed_symbols else None
+
+        return LogicValidator._check_condition_node(
+            node, allowed_metrics_set, allowed_symbols_set, require_symbol_for_metrics,
+            validate_else, else_required, else_label, else_must_be_last, else_require_children,
+        )
+
+    @staticmethod
+    def _check_condition_node(
+        node: Dict[str, Any],
+        allowed_metrics_set: Optional[FrozenSet[str]],
+        allowed_symbols_set: Optional[FrozenSet[str]],
+        require_symbol_for_metrics: bool,
+        validate_else: bool,
+        else_required: bool,
+        else_label: str,
+        else_must_be_last: bool,
+        else_require_children: bool,
+    ) -> Tuple[bool, List[str]]:
+        """Validate a condition node dict against already normalized allowed sets."""
+        errors: List[str] = []
 
-        if not isinstance(node, dict):
-            errors.append("condition node must be a dict")
-            return False, errors
-        
         node_id = node.get("id")
 
         if node.get("type") != "condition":
@@ -362,74 +566,13 @@ class LogicValidator:
             op = ""
         
         if flag_check_for_operator and op is not None and op not in _CONDITION_OPS:
-            errors.append(f"condition.operator must be one of {sorted(_CONDITION_OPS)}")
-
-        allowed_metrics_set: Optional[Set[str]] = set(m.lower() for m in allowed_metrics) if allowed_metrics else None
-        allowed_symbols_set: Optional[Set[str]] = set(s.upper() for s in allowed_symbols) if allowed_symbols else None
-
-        # ---- helpers ----
-        def _is_number(x: Any) -> bool:
-            return isinstance(x, (int, float)) and not isinstance(x, bool)
-
-        def _validate_metric(m: Any, side: str) -> Tuple[Optional[Dict[str, Any]], None]:
-            if not isinstance(m, dict):
-                errors.append(f"For condition '{node_id}', {side}: metric operand must be an object")
-                return None, None
-            name = m.get("name")
-            if not isinstance(name, str) or not name.strip():
-                errors.append(f"For condition '{node_id}', {side}: metric.name must be a non-empty string")
-                return None, None
-            lname = name.strip().lower()
-
-            if allowed_metrics_set is not None and lname not in allowed_metrics_set:
-                errors.append(f"For condition '{node_id}', {side}: metric.name '{name}' is not in allowed_metrics")
-
-            args = m.get("args", {})
-            if args is None:
-                args = {}
-            if not isinstance(args, dict):
-                errors.append(f"For condition '{node_id}', {side}: metric.args must be a dict when provided")
-                args = {}
-
-            sym = m.get("symbol")
-            sym_norm = None
-            if require_symbol_for_metrics:
-                if not isinstance(sym, str) or not sym.strip():
-                    errors.append(f"For condition '{node_id}', {side}: metric.symbol is required and must be a non-empty string")
-                else:
-                    sym_norm = sym.strip().upper()
-            elif isinstance(sym, str) and sym.strip():
-                sym_norm = sym.strip().upper()
-
-            if allowed_symbols_set is not None and sym_norm is not None and sym_norm not in allowed_symbols_set:
-                errors.append(f"For condition '{node_id}', {side}: symbol '{sym_norm}' is not in allowed_symbols")
-
-            # minimal metric-specific checks (extend as needed)
-            if lname in {"moving-average-price", "rsi"}:
-                period = args.get("period")
-                if not isinstance(period, int) or period <= 0:
-                    errors.append(f"For condition '{node_id}', {side}: metric '{name}' requires args.period as positive int")
-
-            return {"kind": "metric", "name": name, "args": args, "symbol": sym_norm}, None
-
-        def _parse_operand(x: Any, side: str) -> Dict[str, Any]:
-            # metric object?
-            if isinstance(x, dict) and "name" in x:
-                parsed, _ = _validate_metric(x, side)
-                if parsed is None:
-                    return {"kind": "invalid"}
-                return parsed
-            # numeric literal?
-            if _is_number(x):
-                return {"kind": "literal", "value": float(x)}
-            errors.append(f"For condition '{node_id}', {side}: operand must be a metric object or a numeric literal")
-            return {"kind": "invalid"}
+            errors.append(_CONDITION_OPS_MSG)
 
         # ---- parse operands ----
         
         if "lhs" in node:
         
-            lhs_norm = _parse_operand(node["lhs"], "lhs")
+            lhs_norm = _parse_condition_operand(node["lhs"], "lhs", node_id, errors, allowed_metrics_set, allowed_symbols_set, require_symbol_for_metrics)
             
         else:
             
@@ -437,26 +580,24 @@ class LogicValidator:
             
         if "rhs" in node:
             
-            rhs_norm = _parse_operand(node["rhs"], "rhs")
+            rhs_norm = _parse_condition_operand(node["rhs"], "rhs", node_id, errors, allowed_metrics_set, allowed_symbols_set, require_symbol_for_metrics)
             
         else:
             
             rhs_norm = {"kind": "invalid"}
             
-        node_id = node.get("id")
                 
 
         # ---- operator-specific constraints ----
-        if flag_check_for_operator and op in {"crosses_above", "crosses_below"}:
+        if flag_check_for_operator and op in _CROSS_OPS:
             if lhs_norm.get("kind") != "metric" or rhs_norm.get("kind") != "metric":
                 errors.append(f"For condition '{node_id}',{op} requires both lhs and rhs to be metrics (no literals)")
 
-        if flag_check_for_operator and op in {"gt","gte","lt","lte","eq","neq"}:
+        if flag_check_for_operator and op in _COMPARISON_OPS:
             if lhs_norm.get("kind") == "literal" and rhs_norm.get("kind") == "literal":
                 errors.append(f"For condition '{node_id}', {op} requires at least one operand to be a metric")
 
         # ---- optional id/description ----
-        node_id = node.get("id")
         if node_id is not None and not isinstance(node_id, str):
             errors.append(f"For condition '{node_id}', condition.id must be a string when provided")
             node_id = None
@@ -480,15 +621,7 @@ class LogicValidator:
             # Find groups labeled as Else branch (case-insensitive match)
             label_norm = (else_label or "").strip().lower()
 
-            def _is_else_group(c: Any) -> bool:
-                if not isinstance(c, dict):
-                    return False
-                if c.get("type") != "group":
-                    return False
-                d = c.get("description")
-                return isinstance(d, str) and d.strip().lower() == label_norm
-
-            else_idxs: List[int] = [i for i, c in enumerate(children) if _is_else_group(c)]
+            else_idxs: List[int] = _else_group_indexes(children, label_norm)
 
             if else_required and not else_idxs:
                 errors.append(f"For condition '{node_id}', condition requires an Else branch group but none was found")
@@ -565,6 +698,44 @@ class LogicValidator:
             }
         }
         """
+        allowed_symbols_set = _normalized_set(allowed_symbols, _strip_upper) if allowed_symbols is not None else None
+        allowed_metrics_set = _normalized_set(allowed_metrics, _as_is) if allowed_metrics is not None else DEFAULT_ALLOWED_METRICS
+
+        return LogicValidator._check_filter_node(node, allowed_symbols_set, allowed_metrics_set, require_universe_nonempty)
+
+    @staticmethod
+    def make_filter_validator(
+        allowed_symbols: Optional[Iterable[str]] = None,
+        allowed_metrics: Optional[Iterable[str]] = None,
+        require_universe_nonempty: bool = True,
+    ) -> Callable[[Dict[str, Any]], Tuple[bool, List[str]]]:
+        """
+        Build a filter node validator with the allowed lists resolved up front.
+
+        The returned callable behaves like validate_filter_node with these
+        arguments, without normalizing the allowed lists again per node.
+
+        Returns:
+            Callable taking a filter node and returning (is_valid, errors)
+        """
+        allowed_symbols_set = frozenset(map(_strip_upper, allowed_symbols)) if allowed_symbols is not None else None
+        allowed_metrics_set = frozenset(allowed_metrics) if allowed_metrics is not None else DEFAULT_ALLOWED_METRICS
+
+        return partial(
+            LogicValidator._check_filter_node,
+            allowed_symbols_set=allowed_symbols_set,
+            allowed_metrics_set=allowed_metrics_set,
+            require_universe_nonempty=require_universe_nonempty,
+        )
+
+    @staticmethod
+    def _check_filter_node(
+        node: Dict[str, Any],
+        allowed_symbols_set: Optional[FrozenSet[str]],
+        allowed_metrics_set: FrozenSet[str],
+        require_universe_nonempty: bool,
+    ) -> Tuple[bool, List[str]]:
+        """Validate a filter node against already normalized allowed sets."""
         errors: List[str] = []
 
         # --- basic node shape ---
@@ -572,14 +743,13 @@ class LogicValidator:
             
             errors.append("filter node must be a dict")
             
-            return False. errors
+            return False, errors
 
         node_id = node.get("id")
 
         if node.get("type") != "filter":
             errors.append(f"For filter '{node_id}', node.type must be 'filter'")
 
-        node_id = node.get("id")
         if node_id is not None and not isinstance(node_id, str):
             errors.append(f"For filter '{node_id}', filter.id must be a string when provided")
             node_id = None
@@ -598,26 +768,20 @@ class LogicValidator:
             raw_universe = []
 
         # normalize: uppercase, preserve order, drop duplicates
-        seen: Set[str] = set()
-        universe: List[str] = []
-        for s in raw_universe:
-            sym = s.strip().upper()
-            if sym and sym not in seen:
-                seen.add(sym)
-                universe.append(sym)
+        universe: List[str] = list(dict.fromkeys(sym for sym in map(_strip_upper, raw_universe) if sym))
 
         if require_universe_nonempty and len(universe) == 0:
             errors.append(f"For filter '{node_id}', filter.universe must contain at least one symbol")
 
-        if allowed_symbols is not None:
-            allowed_set = {a.strip().upper() for a in allowed_symbols}
-            invalid = [s for s in universe if s not in allowed_set]
-            if invalid:
+        if allowed_symbols_set is not None:
+            # Only list the offending symbols when the subset check fails
+            if not allowed_symbols_set.issuperset(universe):
+                invalid = [s for s in universe if s not in allowed_symbols_set]
                 errors.append(f"For filter '{node_id}', filter.universe contains symbols not allowed: {', '.join(invalid)}")
 
         # --- select & selection.n ---
         select = node.get("select")
-        if select not in {"top", "bottom", "middle"}:
+        if select not in _FILTER_SELECTS:
             errors.append(f"For filter '{node_id}', filter.select must be one of: 'top', 'bottom', 'middle'")
 
         selection = node.get("selection", {})
@@ -644,8 +808,7 @@ class LogicValidator:
             else:
                 metric_name = metric_name.strip().lower()
 
-                allowed_set = set(allowed_metrics) if allowed_metrics is not None else DEFAULT_ALLOWED_METRICS
-                if metric_name not in allowed_set:
+                if metric_name not in allowed_metrics_set:
                     errors.append(f"For filter '{node_id}', filter.metric.name '{metric_name}' is not allowed")
 
             # symbol is not expected in filter.metric (ranking over universe)
@@ -682,10 +845,6 @@ class LogicValidator:
             Dict: _description_
         """
         
-        ALLOCATION_METHODS = ["explicit_weights", "inverse_volatility"]
-        
-        type_of_node = node.get("type")
-        
         error_lines = []
         
         if not isinstance(node, dict):
@@ -696,7 +855,7 @@ class LogicValidator:
         
         node_id = node.get("id")
         
-        if type_of_node != "weight":
+        if node.get("type") != "weight":
             
             error_lines.append(f"For weight {node_id}, Weight node must be a type 'weight'")
             
@@ -706,9 +865,9 @@ class LogicValidator:
             
             error_lines.append(f"For weight {node_id}, Weight node must have an allocation_method")
             
-        elif allocation_method not in ALLOCATION_METHODS:
+        elif allocation_method not in _WEIGHT_ALLOCATION_METHODS:
             
-            error_lines.append(f"For weight {node_id}, Weight node allocation_method must be one of: {', '.join(ALLOCATION_METHODS)}")
+            error_lines.append(f"For weight {node_id}, {_WEIGHT_ALLOCATION_METHODS_MSG}")
 
         is_valid = len(error_lines) == 0
         
@@ -716,21 +875,20 @@ class LogicValidator:
 
     @staticmethod
     def handle_validation_errors(is_valid, errors):
-        """_summary_
+        """
+        Raise the errors of a node that failed validation.
 
         Args:
-            is_valid (bool): _description_
-            errors (_type_): _description_
+            is_valid (bool): True if the node is valid
+            errors (List[str]): Validation errors of the node
+
+        Raises:
+            StrategyValidationError: If the node is not valid
         """
         
         if not is_valid:
             
-            for error in errors:
-                
-                print(f"Error: {error}")
-                
-            
-            sys.exit()
+            raise StrategyValidationError(errors)
 
     @staticmethod
     def check_node_type_and_validate(data, allowed_symbols):
@@ -744,57 +902,24 @@ class LogicValidator:
         # Get node type
         type_of_node = data.get('type')
             
-        # Validate node type
-        if type_of_node == 'condition':
-            
-            # Validate condition node
-            is_valid, errors = LogicValidator.validate_condition_node(data)
-            
-            # Handle validation errors
-            LogicValidator.handle_validation_errors(is_valid, errors)
-            
-        # Validate group node
-        elif type_of_node == 'group':
-            
-            # Validate group node
-            is_valid, errors = LogicValidator.validate_group_node(data)
-            
-            # Handle validation errors
-            LogicValidator.handle_validation_errors(is_valid, errors)
-            
-        # Validate order node
-        elif type_of_node == 'order':
-            
-            # Validate order node
-            is_valid, errors = LogicValidator.validate_order_node(data, allowed_symbols)
-            
-            # Handle validation errors
-            LogicValidator.handle_validation_errors(is_valid, errors)
-            
-        # Validate filter node
-        elif type_of_node == 'filter':
-            
-            # Validate filter node
-            is_valid, errors = LogicValidator.validate_filter_node(data, allowed_symbols=allowed_symbols)
-            
-            # Handle validation errors
-            LogicValidator.handle_validation_errors(is_valid, errors)
-            
-        elif type_of_node == 'weight':
-            
-            # Validate weight node
-            is_valid, errors = LogicValidator.validate_weight_node(data, allowed_symbols=allowed_symbols)
-            
-            # Handle validation errors
-            LogicValidator.handle_validation_errors(is_valid, errors)
-            
-        else:
+        # Look up the validator for this node type
+        validate_node = _NODE_VALIDATORS.get(type_of_node) if isinstance(type_of_node, str) else None
+        
+        if validate_node is None:
             
             # Unknown node type
             errors = [f"Unknown node type: {type_of_node}"]
             
             # Handle validation errors
             LogicValidator.handle_validation_errors(False, errors)
+            
+            return
+        
+        # Validate the node
+        is_valid, errors = validate_node(data, allowed_symbols)
+        
+        # Handle validation errors
+        LogicValidator.handle_validation_errors(is_valid, errors)
     
     def __init__(self):
         
@@ -803,51 +928,67 @@ class LogicValidator:
     @staticmethod
     def trace_json_data_recursive(data: Any, allowed_symbols: list) -> str:
         """
-        This method is used to recursively trace the JSON data and validate it against the allowed symbols.
+        This method is used to trace the JSON data and validate it against the allowed symbols.
+
+        Nodes are visited depth-first in document order, each one once, using
+        an explicit stack so deeply nested logic can't hit the recursion limit.
+        Every node is validated; the errors of all failing nodes are raised
+        together at the end.
 
         Args:
             data (Any): _description_
             allowed_symbols (list): _description_
 
+        Raises:
+            StrategyValidationError: If any node fails validation
         """
         
         # Check if children exist
-        if 'children' in data:
+        if 'children' not in data:
             
-            # Get children data
-            chidren_data = data['children']
+            # Validate the data itself
+            LogicValidator.check_node_type_and_validate(data, allowed_symbols)
             
-            # Check if children data is a list
-            if isinstance(chidren_data, list):
-                
-                # Iterate over each child
-                for item in chidren_data:
-                    
-                    # Check if item is a dictionary
-                    if isinstance(item, dict):
-                        
-                        # Validate and trace the child
-                        LogicValidator.check_node_type_and_validate(item, allowed_symbols)
-                    
-                        # Recursively trace the child
-                        LogicValidator.trace_json_data_recursive(item, allowed_symbols)
-                
-            # Check if children data is a dictionary
-            elif isinstance(chidren_data, dict):
-                
-                # Validate and trace the children
-                LogicValidator.check_node_type_and_validate(chidren_data, allowed_symbols)
-                
-                # Recursively trace the children
-                LogicValidator.trace_json_data_recursive(chidren_data, allowed_symbols)
-                
+            return
+        
+        # Children still to be traced, next one on top
+        stack = _child_nodes(data['children'])
+        stack.reverse()
+        
+        # Errors of every failing node, raised together once the walk is done
+        errors = []
+        
+        while stack:
             
-        else:
+            item = stack.pop()
             
-            # Validate and trace the data
-            LogicValidator.check_node_type_and_validate(data, allowed_symbols)
+            # Validate the child
+            try:
+                LogicValidator.check_node_type_and_validate(item, allowed_symbols)
+            except StrategyValidationError as e:
+                errors.extend(e.errors)
+            
+            # Trace its children before the child's next sibling
+            if 'children' in item:
+                
+                grandchildren = _child_nodes(item['children'])
+                grandchildren.reverse()
+                stack.extend(grandchildren)
+        
+        if errors:
             
+            raise StrategyValidationError(errors)
     
     def validate_logic(self, logic: Any, allowed_symbols: list) -> Dict[str, Any]:
         
-        LogicValidator.trace_json_data_recursive(logic, allowed_symbols)
\ No newline at end of file
+        LogicValidator.trace_json_data_recursive(logic, allowed_symbols)
+
+
+# Validator for each node type, called as validate(node, allowed_symbols)
+_NODE_VALIDATORS: Dict[str, Callable[[Dict[str, Any], Any], Tuple[bool, List[str]]]] = {
+    'condition': lambda data, allowed_symbols: LogicValidator.validate_condition_node(data),
+    'group': lambda data, allowed_symbols: LogicValidator.validate_group_node(data),
+    'order': LogicValidator.validate_order_node,
+    'filter': lambda data, allowed_symbols: LogicValidator.validate_filter_node(data, allowed_symbols=allowed_symbols),
+    'weight': lambda data, allowed_symbols: LogicValidator.validate_weight_node(data, allowed_symbols=allowed_symbols),
+}
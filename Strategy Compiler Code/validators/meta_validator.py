@@ -4,6 +4,21 @@ from typing import Dict, List, Any, Tuple
 from pathlib import Path
 import os
 
+from validators.spec_files import ValidationResult, find_spec_files, load_json_file, validate_spec_files
+
+
+# Names of the types json.load produces, used in "got <type>" error messages
+_TYPENAME = {
+    str: "str", int: "int", float: "float", bool: "bool",
+    list: "list", dict: "dict", type(None): "NoneType"
+}
+
+
+def _type_name(value: Any) -> str:
+    """Return the type name of a value for error messages."""
+    value_type = type(value)
+    return _TYPENAME.get(value_type) or value_type.__name__
+
 
 class MetaValidator:
     """
@@ -18,16 +33,35 @@ class MetaValidator:
     market_neutral, long_short, buy_hold, tactical, other
     """
     
-    VALID_CATEGORIES = {
+    # No per-instance state; constants below are class attributes
+    __slots__ = ()
+    
+    VALID_CATEGORIES = frozenset({
         "momentum", "mean_reversion", "trend_following", "arbitrage",
         "market_neutral", "long_short", "buy_hold", "tactical", "other"
-    }
+    })
+    
+    # ASCII digits only; \Z also rejects a trailing newline
+    VERSION_PATTERN = re.compile(r'^[0-9]+\.[0-9]+(?:\.[0-9]+)?\Z', re.ASCII)
+    
+    NAME_MAX_LENGTH = 500
+    DESCRIPTION_MAX_LENGTH = 5000
+    
+    # Properties defined by the schema and additional properties that are expected
+    SCHEMA_PROPERTIES = frozenset({'name', 'description', 'version', 'category'})
+    EXPECTED_ADDITIONAL_PROPERTIES = frozenset({
+        'source', 'source_id', 'source_url', 'complexity_score',
+        'created_at', 'updated_at'
+    })
     
-    VERSION_PATTERN = re.compile(r'^\d+\.\d+(\.\d+)?$')
+    # Every property that does not produce an "unexpected property" warning
+    EXPECTED_PROPERTIES = SCHEMA_PROPERTIES | EXPECTED_ADDITIONAL_PROPERTIES
     
-    def __init__(self):
-        self.validation_errors = []
-        self.validation_warnings = []
+    # Category options listed in error messages, built once at class load
+    CATEGORY_OPTIONS = ', '.join(sorted(VALID_CATEGORIES))
+    
+    # Upper bound on workers used to validate sample files
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
     
     def validate_meta_property(self, meta: Dict[str, Any], file_path: str = "") -> Tuple[bool, List[str], List[str]]:
         """
@@ -41,169 +75,176 @@ class MetaValidator:
             Tuple of (is_valid, errors, warnings)
         """
         
-        self.validation_errors.clear()
-        self.validation_warnings.clear()
-        
         # Check required properties
-        self._validate_required_fields(meta, file_path)
+        errors = self._validate_required_fields(meta, file_path)
         
         # Validate individual properties
-        self._validate_name(meta.get('name'), file_path)
-        self._validate_version(meta.get('version'), file_path)
-        self._validate_description(meta.get('description'), file_path)
-        self._validate_category(meta.get('category'), file_path)
+        errors += self._validate_name(meta.get('name'), file_path)
+        errors += self._validate_version(meta.get('version'), file_path)
+        errors += self._validate_description(meta.get('description'), file_path)
+        errors += self._validate_category(meta.get('category'), file_path)
         
         # Check for common additional properties
-        self._check_additional_properties(meta, file_path)
+        warnings = self._check_additional_properties(meta, file_path)
         
-        is_valid = len(self.validation_errors) == 0
-        return is_valid, self.validation_errors.copy(), self.validation_warnings.copy()
+        is_valid = len(errors) == 0
+        return is_valid, errors, warnings
     
-    def _validate_required_fields(self, meta: Dict[str, Any], file_path: str):
+    def _validate_required_fields(self, meta: Dict[str, Any], file_path: str) -> List[str]:
         """Validate required fields are present."""
+        errors = []
+        
         if 'name' not in meta:
-            self.validation_errors.append(f"{file_path}: Missing required field 'name' in meta")
+            errors.append(f"{file_path}: Missing required field 'name' in meta")
         
         if 'version' not in meta:
-            self.validation_errors.append(f"{file_path}: Missing required field 'version' in meta")
+            errors.append(f"{file_path}: Missing required field 'version' in meta")
+        
+        return errors
     
-    def _validate_name(self, name: Any, file_path: str):
+    def _validate_name(self, name: Any, file_path: str) -> List[str]:
         """Validate name field."""
-        
+        errors = []
         
         if not isinstance(name, str):
-            self.validation_errors.append(f"{file_path}: meta.name must be a string, got {type(name).__name__}")
-            return
+            errors.append(f"{file_path}: meta.name must be a string, got {_type_name(name)}")
+            return errors
         
         if len(name) == 0:
-            self.validation_errors.append(f"{file_path}: meta.name cannot be empty (minLength: 1)")
-        elif len(name) > 500:
-            self.validation_errors.append(f"{file_path}: meta.name exceeds maximum length of 500 characters")
+            errors.append(f"{file_path}: meta.name cannot be empty (minLength: 1)")
+        elif len(name) > self.NAME_MAX_LENGTH:
+            errors.append(f"{file_path}: meta.name exceeds maximum length of {self.NAME_MAX_LENGTH} characters")
+        
+        return errors
     
-    def _validate_version(self, version: Any, file_path: str):
+    def _validate_version(self, version: Any, file_path: str) -> List[str]:
         """Validate version field."""
+        errors = []
+        
         if version is None:
-            return  # Already handled in required fields check
+            return errors  # Already handled in required fields check
         
         if not isinstance(version, str):
-            self.validation_errors.append(f"{file_path}: meta.version must be a string, got {type(version).__name__}")
-            return
+            errors.append(f"{file_path}: meta.version must be a string, got {_type_name(version)}")
+            return errors
         
         if not self.VERSION_PATTERN.match(version):
-            self.validation_errors.append(
+            errors.append(
                 f"{file_path}: meta.version '{version}' does not match required pattern (e.g., '1.0', '1.2.3')"
             )
+        
+        return errors
     
-    def _validate_description(self, description: Any, file_path: str):
+    def _validate_description(self, description: Any, file_path: str) -> List[str]:
         """Validate description field if present."""
+        errors = []
+        
         if description is None:
-            return
+            return errors
         
         if not isinstance(description, str):
-            self.validation_errors.append(f"{file_path}: meta.description must be a string, got {type(description).__name__}")
-            return
+            errors.append(f"{file_path}: meta.description must be a string, got {_type_name(description)}")
+            return errors
         
-        if len(description) > 5000:
-            self.validation_errors.append(f"{file_path}: meta.description exceeds maximum length of 5000 characters")
+        if len(description) > self.DESCRIPTION_MAX_LENGTH:
+            errors.append(f"{file_path}: meta.description exceeds maximum length of {self.DESCRIPTION_MAX_LENGTH} characters")
+        
+        return errors
     
-    def _validate_category(self, category: Any, file_path: str):
+    def _validate_category(self, category: Any, file_path: str) -> List[str]:
         """Validate category field if present."""
+        errors = []
+        
         if category is None:
-            return
+            return errors
         
         if not isinstance(category, str):
-            self.validation_errors.append(f"{file_path}: meta.category must be a string, got {type(category).__name__}")
-            return
+            errors.append(f"{file_path}: meta.category must be a string, got {_type_name(category)}")
+            return errors
         
         if category not in self.VALID_CATEGORIES:
-            self.validation_errors.append(
+            errors.append(
                 f"{file_path}: meta.category '{category}' is not a valid category. "
-                f"Valid options: {', '.join(sorted(self.VALID_CATEGORIES))}"
+                f"Valid options: {self.CATEGORY_OPTIONS}"
             )
+        
+        return errors
     
-    def _check_additional_properties(self, meta: Dict[str, Any], file_path: str):
+    def _check_additional_properties(self, meta: Dict[str, Any], file_path: str) -> List[str]:
         """Check for common additional properties and warn about unexpected ones."""
-        expected_additional = {
-            'source', 'source_id', 'source_url', 'complexity_score', 
-            'created_at', 'updated_at'
-        }
+        warnings = []
         
-        schema_defined = {'name', 'description', 'version', 'category'}
+        # Common case: nothing unexpected, answered by a single set comparison
+        if meta.keys() <= self.EXPECTED_PROPERTIES:
+            return warnings
         
-        for key in meta.keys():
-            if key not in schema_defined and key not in expected_additional:
-                self.validation_warnings.append(
-                    f"{file_path}: Unexpected additional property 'meta.{key}' found"
-                )
+        # Walk the keys themselves so warnings keep the order of the meta object
+        warnings.extend([
+            f"{file_path}: Unexpected additional property 'meta.{key}' found"
+            for key in meta if key not in self.EXPECTED_PROPERTIES
+        ])
+        
+        return warnings
     
-    def validate_sample_files(self, sample_inputs_dir: str) -> Dict[str, Tuple[bool, List[str], List[str]]]:
+    def validate_sample_files(self, sample_inputs_dir: str, use_processes: bool = False) -> Dict[str, ValidationResult]:
         """
         Validate all sample input files in the given directory.
         
         Args:
             sample_inputs_dir: Path to directory containing sample strategy files
+            use_processes: Validate on a process pool instead of a thread pool
+            
+        Returns:
+            Dictionary mapping file paths to ValidationResult tuples
+        """
+        spec_files = find_spec_files(sample_inputs_dir)
+        return validate_spec_files(spec_files, self._validate_one_file, self.MAX_WORKERS, use_processes)
+    
+    def _validate_one_file(self, spec_file: str) -> Tuple[str, ValidationResult]:
+        """
+        Validate the meta property of a single spec file.
+        
+        Args:
+            spec_file: Path to the spec JSON file
             
         Returns:
-            Dictionary mapping file paths to validation results
+            Tuple of (spec_file, ValidationResult)
         """
-        results = {}
-        sample_path = Path(sample_inputs_dir)
-        
-        if not sample_path.exists():
-            raise FileNotFoundError(f"Sample inputs directory not found: {sample_inputs_dir}")
-        
-        # Find all spec JSON files
-        spec_files = list(sample_path.glob("*/spec_*.json"))
-        
-        for spec_file in spec_files:
-            try:
-                with open(spec_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if 'meta' not in data:
-                    results[str(spec_file)] = (False, [f"No 'meta' property found"], [])
-                    continue
-                
-                is_valid, errors, warnings = self.validate_meta_property(data['meta'], str(spec_file))
-                results[str(spec_file)] = (is_valid, errors, warnings)
-                
-            except json.JSONDecodeError as e:
-                results[str(spec_file)] = (False, [f"JSON decode error: {e}"], [])
-            except Exception as e:
-                results[str(spec_file)] = (False, [f"Unexpected error: {e}"], [])
-        
-        return results
+        try:
+            data = load_json_file(spec_file)
+            
+            if 'meta' not in data:
+                return spec_file, ValidationResult(False, [f"No 'meta' property found"], [])
+            
+            return spec_file, ValidationResult(*self.validate_meta_property(data['meta'], spec_file))
+            
+        except json.JSONDecodeError as e:
+            return spec_file, ValidationResult(False, [f"JSON decode error: {e}"], [])
+        except Exception as e:
+            return spec_file, ValidationResult(False, [f"Unexpected error: {e}"], [])
     
     def generate_validation_report(self, results: Dict[str, Tuple[bool, List[str], List[str]]]) -> str:
         """Generate a human-readable validation report."""
-        report_lines = []
-        report_lines.append("Meta Property Validation Report")
-        report_lines.append("=" * 35)
-        report_lines.append("")
-        
         total_files = len(results)
         valid_files = sum(1 for is_valid, _, _ in results.values() if is_valid)
         
-        report_lines.append(f"Total files validated: {total_files}")
-        report_lines.append(f"Valid files: {valid_files}")
-        report_lines.append(f"Invalid files: {total_files - valid_files}")
-        report_lines.append("")
+        report_lines = [
+            "Meta Property Validation Report",
+            "=" * 35,
+            "",
+            f"Total files validated: {total_files}",
+            f"Valid files: {valid_files}",
+            f"Invalid files: {total_files - valid_files}",
+            "",
+        ]
         
         for file_path, (is_valid, errors, warnings) in results.items():
-            filename = Path(file_path).name
             status = "✓ VALID" if is_valid else "✗ INVALID"
-            report_lines.append(f"{status}: {filename}")
-            
-            if errors:
-                for error in errors:
-                    # Remove file path prefix from error message for cleaner display
-                    clean_error = error.split(": ", 1)[-1] if ": " in error else error
-                    report_lines.append(f"  ERROR: {clean_error}")
+            report_lines.append(f"{status}: {os.path.basename(file_path)}")
             
-            if warnings:
-                for warning in warnings:
-                    clean_warning = warning.split(": ", 1)[-1] if ": " in warning else warning
-                    report_lines.append(f"  WARNING: {clean_warning}")
+            # Remove file path prefix from messages for cleaner display
+            report_lines.extend([f"  ERROR: {error.split(': ', 1)[-1]}" for error in errors])
+            report_lines.extend([f"  WARNING: {warning.split(': ', 1)[-1]}" for warning in warnings])
             
             report_lines.append("")
         
@@ -1,8 +1,64 @@
-import re
-from datetime import datetime
+import json
+from datetime import date
+from functools import partial
 from typing import Dict, List, Any, Optional, Tuple
 
 
+def _parse_iso_date(value: Any) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a strict YYYY-MM-DD date string.
+    
+    Args:
+        value: Value to parse
+        
+    Returns:
+        Tuple of (year, month, day), or None if the value is not a valid date
+    """
+    # fromisoformat also accepts other ISO 8601 forms (e.g. 20240101),
+    # so pin the shape first
+    if not isinstance(value, str) or len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return None
+    
+    try:
+        parsed = date.fromisoformat(value)
+    except ValueError:
+        return None
+    
+    return parsed.year, parsed.month, parsed.day
+
+
+class SettingsErrors(list):
+    """
+    List of settings error messages that also records a short code per error.
+    
+    Behaves like the plain list of messages returned previously, with a
+    ``codes`` set (e.g. "capital_required", "start_date_format") so callers
+    can check for a specific error without scanning the messages.
+    """
+    
+    __slots__ = ('codes',)
+    
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.codes = set()
+    
+    def add(self, code: str, message: str) -> None:
+        """Append an error message and record its code."""
+        self.append(message)
+        self.codes.add(code)
+    
+    def extend(self, errors) -> None:
+        """Extend with error messages, merging codes when present."""
+        super().extend(errors)
+        self.codes.update(getattr(errors, 'codes', ()))
+
+
+# Results of validate_settings keyed by (validator class, settings serialized
+# with json.dumps(sort_keys=True)); the oldest entry is dropped when full
+_SETTINGS_RESULTS: Dict[Tuple[type, str], Tuple[bool, Tuple[str, ...], frozenset]] = {}
+_SETTINGS_RESULTS_MAX = 256
+
+
 class SettingsValidator:
     """
     Validates the settings property from StrategySpec JSON.
@@ -11,16 +67,24 @@ class SettingsValidator:
     and benchmark settings according to the StrategySpec v1 schema.
     """
     
-    VALID_REBALANCE_VALUES = {
+    # No per-instance state; constants below are class attributes
+    __slots__ = ()
+    
+    VALID_REBALANCE_VALUES = frozenset({
         "none", "intraday", "daily", "weekly", "monthly", "quarterly", "yearly"
-    }
+    })
     
-    VALID_SLIPPAGE_MODELS = {
+    VALID_SLIPPAGE_MODELS = frozenset({
         "fixed", "percentage", "volumeImpact"
-    }
+    })
+    
+    VALID_FEE_FIELDS = frozenset({'perOrder', 'perShare', 'percentage'})
     
-    CURRENCY_PATTERN = re.compile(r'^[A-Z]{3}$')
-    DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+    VALID_SLIPPAGE_FIELDS = frozenset({'model', 'value'})
+    
+    # Allowed values listed in error messages, built once at class load
+    REBALANCE_OPTIONS = ", ".join(sorted(VALID_REBALANCE_VALUES))
+    SLIPPAGE_MODEL_OPTIONS = ", ".join(sorted(VALID_SLIPPAGE_MODELS))
     
     def __init__(self):
         """Initialize the SettingsValidator with default settings."""
@@ -34,42 +98,46 @@ class SettingsValidator:
             settings: Settings object from StrategySpec
             
         Returns:
-            Tuple of (is_valid: bool, error_messages: List[str])
+            Tuple of (is_valid: bool, error_messages: SettingsErrors), where
+            error_messages.codes holds the code of each error
         """
-        if not isinstance(settings, dict):
-            return False, ["Settings must be a dictionary/object"]
-        
-        errors = []
-        
-        # Validate required fields
-        capital_errors = self._validate_capital(settings.get('capital'))
-        errors.extend(capital_errors)
-        
-        rebalance_errors = self._validate_rebalance(settings.get('rebalance'))
-        errors.extend(rebalance_errors)
-        
-        # Validate start date fields
-        start_errors = self._validate_date_field(settings.get('start'), 'start')
-        errors.extend(start_errors)
-
-
-        end_errors = self._validate_date_field(settings.get('end'), 'end')
-        errors.extend(end_errors)
-        
-        if 'currency' in settings:
-        
-            currency_errors = self._validate_currency(settings.get('currency'))
-            errors.extend(currency_errors)
-            
-        if 'fees' in settings:
-        
-            fees_errors = self._validate_fees(settings.get('fees'))
-            errors.extend(fees_errors)
-            
-        if 'slippage' in settings:
-            
-            slippage_errors = self._validate_slippage(settings.get('slippage'))
-            errors.extend(slippage_errors)
+        try:
+            key = (type(self), json.dumps(settings, sort_keys=True))
+        except (TypeError, ValueError):
+            # Not plain JSON data, so there is no stable cache key
+            return self._check_settings(settings)
+        
+        cached = _SETTINGS_RESULTS.get(key)
+        if cached is None:
+            # The JSON text only keys the cache; the caller's object is validated
+            is_valid, errors = self._check_settings(settings)
+            if len(_SETTINGS_RESULTS) >= _SETTINGS_RESULTS_MAX:
+                _SETTINGS_RESULTS.pop(next(iter(_SETTINGS_RESULTS)), None)
+            _SETTINGS_RESULTS[key] = (is_valid, tuple(errors), frozenset(errors.codes))
+            return is_valid, errors
+        
+        is_valid, messages, codes = cached
+        
+        # Return a new list per call so callers can't alter the cached result
+        errors = SettingsErrors(messages)
+        errors.codes.update(codes)
+        return is_valid, errors
+    
+    def _check_settings(self, settings: Any) -> Tuple[bool, SettingsErrors]:
+        """Validate settings without consulting the results cache."""
+        errors = SettingsErrors()
+        
+        # Exact type check first; isinstance only runs for dict subclasses
+        # and non-dicts
+        if type(settings) is not dict and not isinstance(settings, dict):
+            errors.add("settings_type", "Settings must be a dictionary/object")
+            return False, errors
+        
+        # Required fields are validated even when missing, optional fields
+        # only when present
+        for field, validate_field, required in self._FIELD_VALIDATORS:
+            if required or field in settings:
+                errors.extend(validate_field(self, settings.get(field)))
         
         # Validate date logic (start <= end)
         if 'start' in settings and 'end' in settings:
@@ -78,234 +146,231 @@ class SettingsValidator:
         
         return len(errors) == 0, errors
     
-    def _validate_capital(self, capital: Any) -> List[str]:
+    def _validate_capital(self, capital: Any) -> SettingsErrors:
         """Validate capital field (required, number, minimum 0)."""
-        errors = []
+        errors = SettingsErrors()
         
         if capital is None:
-            errors.append("Capital is required")
+            errors.add("capital_required", "Capital is required")
             return errors
         
-        # Exclude boolean from number types (bool is subclass of int in Python)
-        if not isinstance(capital, (int, float)) or isinstance(capital, bool):
-            errors.append("Capital must be a number")
+        # Exclude boolean from number types (bool is subclass of int in Python),
+        # checked first since it is a single identity comparison
+        if type(capital) is bool or not isinstance(capital, (int, float)):
+            errors.add("capital_type", "Capital must be a number")
             return errors
         
         if capital < 0:
-            errors.append("Capital must be greater than or equal to 0")
+            errors.add("capital_minimum", "Capital must be greater than or equal to 0")
         
         return errors
     
-    def _validate_rebalance(self, rebalance: Any) -> List[str]:
+    def _validate_rebalance(self, rebalance: Any) -> SettingsErrors:
         """Validate rebalance field (required, enum)."""
-        errors = []
+        errors = SettingsErrors()
         
         if rebalance is None:
-            errors.append("Rebalance is required")
+            errors.add("rebalance_required", "Rebalance is required")
             return errors
         
         if not isinstance(rebalance, str):
-            errors.append("Rebalance must be a string")
+            errors.add("rebalance_type", "Rebalance must be a string")
             return errors
         
         if rebalance not in self.VALID_REBALANCE_VALUES:
-            valid_values = ", ".join(sorted(self.VALID_REBALANCE_VALUES))
-            errors.append(f"Rebalance must be one of: {valid_values}")
+            errors.add("rebalance_invalid", f"Rebalance must be one of: {self.REBALANCE_OPTIONS}")
         
         return errors
     
-    def _validate_date_field(self, date_value: Any, field_name: str) -> List[str]:
+    def _validate_date_field(self, date_value: Any, field_name: str) -> SettingsErrors:
         """Validate date fields (start/end) format."""
-        errors = []
+        errors = SettingsErrors()
         
         if date_value is None:
-            errors.append(f"{field_name.capitalize()} is required")
+            errors.add(f"{field_name}_required", f"{field_name.capitalize()} is required")
             return errors
         
         if not isinstance(date_value, str):
-            errors.append(f"{field_name.capitalize()} date must be a string")
+            errors.add(f"{field_name}_date_type", f"{field_name.capitalize()} date must be a string")
             return errors
         
-        # First check strict format with regex
-        if not self.DATE_PATTERN.match(date_value):
-            errors.append(f"{field_name.capitalize()} date must be in YYYY-MM-DD format")
-            return errors
-        
-        try:
-            # Validate that it's a real date
-            datetime.strptime(date_value, '%Y-%m-%d')
-        except ValueError:
-            errors.append(f"{field_name.capitalize()} date must be in YYYY-MM-DD format")
+        # Check strict format and that it's a real date
+        if _parse_iso_date(date_value) is None:
+            errors.add(f"{field_name}_date_format", f"{field_name.capitalize()} date must be in YYYY-MM-DD format")
         
         return errors
     
-    def _validate_currency(self, currency: Any) -> List[str]:
+    def _validate_currency(self, currency: Any) -> SettingsErrors:
         """Validate currency field (3-letter uppercase code)."""
-        errors = []
+        errors = SettingsErrors()
         
         if currency is None:
-            errors.append("Currency is required")
+            errors.add("currency_required", "Currency is required")
             return errors
         
         if not isinstance(currency, str):
-            errors.append("Currency must be a string")
+            errors.add("currency_type", "Currency must be a string")
             return errors
         
-        if not self.CURRENCY_PATTERN.match(currency):
-            errors.append("Currency must be a 3-letter uppercase code (e.g., USD, EUR, GBP)")
+        # Three ASCII uppercase letters
+        if not (len(currency) == 3 and currency.isascii() and currency.isalpha() and currency.isupper()):
+            errors.add("currency_format", "Currency must be a 3-letter uppercase code (e.g., USD, EUR, GBP)")
         
         return errors
     
-    def _validate_benchmark(self, benchmark: Any) -> List[str]:
+    def _validate_benchmark(self, benchmark: Any) -> SettingsErrors:
         """Validate benchmark field (string)."""
-        errors = []
+        errors = SettingsErrors()
         
         if not isinstance(benchmark, str):
-            errors.append("Benchmark must be a string")
+            errors.add("benchmark_type", "Benchmark must be a string")
         
         return errors
     
-    def _validate_fees(self, fees: Any) -> List[str]:
+    def _validate_fees(self, fees: Any) -> SettingsErrors:
         """Validate fees nested object."""
-        errors = []
+        errors = SettingsErrors()
         
         if fees is None:
-            errors.append("Fees field is required")
+            errors.add("fees_required", "Fees field is required")
             return errors
         
-        if not isinstance(fees, dict):
-            errors.append("Fees must be an object/dictionary")
+        if type(fees) is not dict and not isinstance(fees, dict):
+            errors.add("fees_type", "Fees must be an object/dictionary")
             return errors
         
         # Validate individual fee fields (all optional)
-        if 'perOrder' in fees:
-            per_order_errors = self._validate_fee_field(fees['perOrder'], 'perOrder')
-            errors.extend(per_order_errors)
-        
-        if 'perShare' in fees:
-            per_share_errors = self._validate_fee_field(fees['perShare'], 'perShare')
-            errors.extend(per_share_errors)
-        
-        if 'percentage' in fees:
-            percentage_errors = self._validate_percentage_fee(fees['percentage'])
-            errors.extend(percentage_errors)
+        for field, validate_field in self._FEE_FIELD_VALIDATORS:
+            if field in fees:
+                errors.extend(validate_field(self, fees[field]))
         
         # Check for unknown fields
-        valid_fee_fields = {'perOrder', 'perShare', 'percentage'}
-        unknown_fields = set(fees.keys()) - valid_fee_fields
+        unknown_fields = fees.keys() - self.VALID_FEE_FIELDS
         if unknown_fields:
             unknown_list = ", ".join(sorted(unknown_fields))
-            errors.append(f"Unknown fee fields: {unknown_list}")
+            errors.add("fees_unknown_fields", f"Unknown fee fields: {unknown_list}")
         
         return errors
     
-    def _validate_fee_field(self, value: Any, field_name: str) -> List[str]:
+    def _validate_fee_field(self, value: Any, field_name: str) -> SettingsErrors:
         """Validate individual fee field (number, minimum 0)."""
-        errors = []
+        errors = SettingsErrors()
         
-        if not isinstance(value, (int, float)) or isinstance(value, bool):
-            errors.append(f"Fee {field_name} must be a number")
+        if type(value) is bool or not isinstance(value, (int, float)):
+            errors.add(f"fee_{field_name}_type", f"Fee {field_name} must be a number")
             return errors
         
         if value < 0:
-            errors.append(f"Fee {field_name} must be greater than or equal to 0")
+            errors.add(f"fee_{field_name}_minimum", f"Fee {field_name} must be greater than or equal to 0")
         
         return errors
     
-    def _validate_percentage_fee(self, percentage: Any) -> List[str]:
+    def _validate_percentage_fee(self, percentage: Any) -> SettingsErrors:
         """Validate percentage fee field (number, 0 <= x <= 1)."""
-        errors = []
+        errors = SettingsErrors()
         
-        if not isinstance(percentage, (int, float)) or isinstance(percentage, bool):
-            errors.append("Fee percentage must be a number")
+        if type(percentage) is bool or not isinstance(percentage, (int, float)):
+            errors.add("fee_percentage_type", "Fee percentage must be a number")
             return errors
         
         if percentage < 0:
-            errors.append("Fee percentage must be greater than or equal to 0")
+            errors.add("fee_percentage_minimum", "Fee percentage must be greater than or equal to 0")
         
         if percentage > 1:
-            errors.append("Fee percentage must be less than or equal to 1")
+            errors.add("fee_percentage_maximum", "Fee percentage must be less than or equal to 1")
         
         return errors
     
-    def _validate_slippage(self, slippage: Any) -> List[str]:
+    def _validate_slippage(self, slippage: Any) -> SettingsErrors:
         """Validate slippage nested object."""
-        errors = []
+        errors = SettingsErrors()
         
         if slippage is None:
-            errors.append("Slippage field is required")
+            errors.add("slippage_required", "Slippage field is required")
             return errors
         
-        if not isinstance(slippage, dict):
-            errors.append("Slippage must be an object/dictionary")
+        if type(slippage) is not dict and not isinstance(slippage, dict):
+            errors.add("slippage_type", "Slippage must be an object/dictionary")
             return errors
         
-        # Validate model field
-        if 'model' in slippage:
-            model_errors = self._validate_slippage_model(slippage['model'])
-            errors.extend(model_errors)
-        
-        # Validate value field
-        if 'value' in slippage:
-            value_errors = self._validate_slippage_value(slippage['value'])
-            errors.extend(value_errors)
+        # Validate model and value fields (both optional)
+        for field, validate_field in self._SLIPPAGE_FIELD_VALIDATORS:
+            if field in slippage:
+                errors.extend(validate_field(self, slippage[field]))
         
         # Check for unknown fields
-        valid_slippage_fields = {'model', 'value'}
-        unknown_fields = set(slippage.keys()) - valid_slippage_fields
+        unknown_fields = slippage.keys() - self.VALID_SLIPPAGE_FIELDS
         if unknown_fields:
             unknown_list = ", ".join(sorted(unknown_fields))
-            errors.append(f"Unknown slippage fields: {unknown_list}")
+            errors.add("slippage_unknown_fields", f"Unknown slippage fields: {unknown_list}")
         
         return errors
     
-    def _validate_slippage_model(self, model: Any) -> List[str]:
+    def _validate_slippage_model(self, model: Any) -> SettingsErrors:
         """Validate slippage model field (enum)."""
-        errors = []
+        errors = SettingsErrors()
         
         if not isinstance(model, str):
-            errors.append("Slippage model must be a string")
+            errors.add("slippage_model_type", "Slippage model must be a string")
             return errors
         
         if model not in self.VALID_SLIPPAGE_MODELS:
-            valid_models = ", ".join(sorted(self.VALID_SLIPPAGE_MODELS))
-            errors.append(f"Slippage model must be one of: {valid_models}")
+            errors.add("slippage_model_invalid", f"Slippage model must be one of: {self.SLIPPAGE_MODEL_OPTIONS}")
         
         return errors
     
-    def _validate_slippage_value(self, value: Any) -> List[str]:
+    def _validate_slippage_value(self, value: Any) -> SettingsErrors:
         """Validate slippage value field (number, minimum 0)."""
-        errors = []
+        errors = SettingsErrors()
         
-        if not isinstance(value, (int, float)) or isinstance(value, bool):
-            errors.append("Slippage value must be a number")
+        if type(value) is bool or not isinstance(value, (int, float)):
+            errors.add("slippage_value_type", "Slippage value must be a number")
             return errors
         
         if value < 0:
-            errors.append("Slippage value must be greater than or equal to 0")
+            errors.add("slippage_value_minimum", "Slippage value must be greater than or equal to 0")
         
         return errors
     
-    def _validate_date_logic(self, start: str, end: str) -> List[str]:
+    def _validate_date_logic(self, start: str, end: str) -> SettingsErrors:
         """Validate that start date is not after end date."""
-        errors = []
+        errors = SettingsErrors()
         
-        try:
-
-
-            start_date = datetime.strptime(start, '%Y-%m-%d')
-            end_date = datetime.strptime(end, '%Y-%m-%d')
-            
-            if start_date > end_date:
-                errors.append("Start date must be on or before end date")
-        except Exception as e:
+        start_date = _parse_iso_date(start)
+        end_date = _parse_iso_date(end)
+        
+        if start_date is None or end_date is None:
             # Date format errors will be caught by individual field validation
-            
-            errors.append("Start & End date must be in YYYY-MM-DD format")
-            pass
+            errors.add("date_format", "Start & End date must be in YYYY-MM-DD format")
+        elif start_date > end_date:
+            # (year, month, day) tuples compare chronologically
+            errors.add("date_order", "Start date must be on or before end date")
         
         return errors
     
+    # (field, validator, required) in the order errors are reported
+    _FIELD_VALIDATORS = (
+        ('capital', _validate_capital, True),
+        ('rebalance', _validate_rebalance, True),
+        ('start', partial(_validate_date_field, field_name='start'), True),
+        ('end', partial(_validate_date_field, field_name='end'), True),
+        ('currency', _validate_currency, False),
+        ('fees', _validate_fees, False),
+        ('slippage', _validate_slippage, False),
+    )
+    
+    # (field, validator) for the optional fields of the nested objects
+    _FEE_FIELD_VALIDATORS = (
+        ('perOrder', partial(_validate_fee_field, field_name='perOrder')),
+        ('perShare', partial(_validate_fee_field, field_name='perShare')),
+        ('percentage', _validate_percentage_fee),
+    )
+    
+    _SLIPPAGE_FIELD_VALIDATORS = (
+        ('model', _validate_slippage_model),
+        ('value', _validate_slippage_value),
+    )
+    
     def validate_settings_structure(self, data: Any) -> Tuple[bool, List[str]]:
         """
         Validate that settings exists and has proper structure.
@@ -316,13 +381,15 @@ class SettingsValidator:
         Returns:
             Tuple of (is_valid: bool, error_messages: List[str])
         """
-        errors = []
+        errors = SettingsErrors()
         
-        if not isinstance(data, dict):
-            return False, ["StrategySpec must be a dictionary/object"]
+        if type(data) is not dict and not isinstance(data, dict):
+            errors.add("spec_type", "StrategySpec must be a dictionary/object")
+            return False, errors
         
         if 'settings' not in data:
-            return False, ["Settings property is required"]
+            errors.add("settings_required", "Settings property is required")
+            return False, errors
         
         # Delegate to main validation
         return self.validate_settings(data['settings'])
@@ -339,6 +406,12 @@ class SettingsValidator:
         """
         is_valid, errors = self.validate_settings(settings)
         
+        # Checked once for the whole comprehension instead of per field
+        field_types = (
+            {field: type(value).__name__ for field, value in settings.items()}
+            if isinstance(settings, dict) else {}
+        )
+        
         summary = {
             'is_valid': is_valid,
             'error_count': len(errors),
@@ -355,11 +428,7 @@ class SettingsValidator:
                 'fees': 'fees' in settings,
                 'slippage': 'slippage' in settings
             },
-            'field_types': {
-                field: type(value).__name__ 
-                for field, value in settings.items() 
-                if isinstance(settings, dict)
-            }
+            'field_types': field_types
         }
         
         return summary
\ No newline at end of file
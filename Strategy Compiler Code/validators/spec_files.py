@@ -0,0 +1,119 @@
+"""
+Sample Spec File Helpers
+
+Finding and loading the spec_*.json files under a sample inputs directory,
+shared by the validators that check a section of every sample spec.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+# orjson is optional; fall back to the standard library parser without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ValidationResult(NamedTuple):
+    """Result of validating one section of a spec file."""
+    is_valid: bool
+    errors: List[str]
+    warnings: List[str]
+
+
+def find_spec_files(sample_inputs_dir: str) -> List[str]:
+    """
+    Find spec_*.json files one directory below the sample inputs directory.
+    
+    Args:
+        sample_inputs_dir: Path to directory containing sample strategy folders
+    
+    Returns:
+        List of spec file paths
+    
+    Raises:
+        FileNotFoundError: If the sample inputs directory does not exist
+    """
+    sample_path = os.fspath(Path(sample_inputs_dir))
+    spec_files = []
+    
+    try:
+        strategy_dirs = [entry.path for entry in os.scandir(sample_path) if entry.is_dir()]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Sample inputs directory not found: {sample_inputs_dir}") from None
+    except NotADirectoryError:
+        return spec_files
+    
+    for strategy_dir in strategy_dirs:
+        with os.scandir(strategy_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('spec_') and name.endswith('.json') and entry.is_file():
+                    spec_files.append(entry.path)
+    
+    return spec_files
+
+
+def load_json_file(file_path: str) -> Any:
+    """
+    Load a JSON file, using orjson when it is installed.
+    
+    Args:
+        file_path: Path to the JSON file
+    
+    Returns:
+        Parsed JSON data
+    
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(f.read())
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def validate_spec_files(
+    spec_files: List[str],
+    validate_one_file: Callable[[str], Tuple[str, ValidationResult]],
+    max_workers: int,
+    use_processes: bool = False,
+) -> Dict[str, ValidationResult]:
+    """
+    Validate spec files concurrently and collect the results by path.
+    
+    Each file is read, parsed and validated independently. The work is
+    mostly file I/O, so a thread pool is used by default; use_processes
+    spreads large batches of big specs over all cores instead, at the cost
+    of starting worker processes and pickling the results back.
+    
+    Args:
+        spec_files: Paths of the spec files to validate
+        validate_one_file: Picklable callable returning (spec_file, result) for one path
+        max_workers: Upper bound on the number of workers
+        use_processes: Validate on a process pool instead of a thread pool
+        
+    Returns:
+        Dictionary mapping file paths to validation results
+    """
+    if len(spec_files) <= 1:
+        return dict(map(validate_one_file, spec_files))
+    
+    workers = min(max_workers, len(spec_files))
+    
+    if use_processes:
+        workers = min(workers, os.cpu_count() or 1)
+        # Hand each process several files at a time to cut down on IPC
+        chunksize = max(1, len(spec_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return dict(executor.map(validate_one_file, spec_files, chunksize=chunksize))
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(validate_one_file, spec_files))
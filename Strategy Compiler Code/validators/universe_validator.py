@@ -1,9 +1,11 @@
 import json
 import re
+import string
 from typing import Dict, List, Any, Tuple
-from pathlib import Path
 import os
 
+from validators.spec_files import ValidationResult, find_spec_files, load_json_file, validate_spec_files
+
 
 class UniverseValidator:
     """
@@ -18,15 +20,26 @@ class UniverseValidator:
     Asset class enum values: EQUITY, ETF, FUTURE, FOREX, CRYPTO, OPTION, BOND, COMMODITY
     """
     
-    VALID_ASSET_CLASSES = {
+    VALID_ASSET_CLASSES = frozenset({
         "EQUITY", "ETF", "FUTURE", "FOREX", "CRYPTO", "OPTION", "BOND", "COMMODITY"
-    }
+    })
+    
+    # Asset class options listed in error messages, built once at class load
+    ASSET_CLASS_OPTIONS = ', '.join(sorted(VALID_ASSET_CLASSES))
+    
+    ASSET_PROPERTIES = frozenset({'symbol', 'name', 'assetClass'})
     
-    SYMBOL_PATTERN = re.compile(r'^[A-Za-z0-9/.:-]{1,20}$')
+    COMMON_ADDITIONAL_PROPERTIES = frozenset({'exchange', 'sector', 'currency', 'market'})
     
-    def __init__(self):
-        self.validation_errors = []
-        self.validation_warnings = []
+    # Schema pattern for symbols; \Z also rejects a trailing newline
+    SYMBOL_PATTERN = re.compile(r'^[A-Za-z0-9/.:-]{1,20}\Z')
+    
+    # Same rule as SYMBOL_PATTERN, checked without the regex engine
+    SYMBOL_CHARS = frozenset(string.ascii_letters + string.digits + "/.:-")
+    SYMBOL_MAX_LENGTH = 20
+    
+    # Upper bound on workers used to validate sample files
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
     
     def validate_universe_property(self, universe: List[Dict[str, Any]], file_path: str = "") -> Tuple[bool, List[str], List[str]]:
         """
@@ -39,184 +52,186 @@ class UniverseValidator:
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        self.validation_errors.clear()
-        self.validation_warnings.clear()
+        # Fresh lists per call so one instance can be shared between callers
+        errors = []
+        warnings = []
         
         # Check universe structure
-        self._validate_universe_structure(universe, file_path)
+        self._validate_universe_structure(universe, file_path, errors)
         
-        if isinstance(universe, list):
+        if type(universe) is list or isinstance(universe, list):
             # Track symbols for duplicate detection
             seen_symbols = set()
             
             # Validate each asset
             for i, asset in enumerate(universe):
-                self._validate_asset(asset, i, file_path, seen_symbols)
+                self._validate_asset(asset, i, file_path, seen_symbols, errors, warnings)
         
-        is_valid = len(self.validation_errors) == 0
-        return is_valid, self.validation_errors.copy(), self.validation_warnings.copy()
+        is_valid = len(errors) == 0
+        return is_valid, errors, warnings
     
-    def _validate_universe_structure(self, universe: Any, file_path: str):
+    def _validate_universe_structure(self, universe: Any, file_path: str, errors: List[str]):
         """Validate universe is a non-empty array."""
-        if not isinstance(universe, list):
-            self.validation_errors.append(f"{file_path}: Universe must be an array, got {type(universe).__name__}")
+        # Exact type check first; isinstance only runs for list subclasses
+        # and non-lists
+        if type(universe) is not list and not isinstance(universe, list):
+            errors.append(f"{file_path}: Universe must be an array, got {type(universe).__name__}")
             return
         
         if len(universe) == 0:
-            self.validation_errors.append(f"{file_path}: Universe must contain at least one asset (minItems: 1)")
+            errors.append(f"{file_path}: Universe must contain at least one asset (minItems: 1)")
+    
+    @staticmethod
+    def _asset_path(file_path: str, index: int) -> str:
+        """Location prefix for messages about the asset at index."""
+        # Built only when a message is reported, not for every valid asset
+        return f"{file_path}[{index}]" if file_path else f"asset[{index}]"
     
-    def _validate_asset(self, asset: Any, index: int, file_path: str, seen_symbols: set):
+    def _validate_asset(self, asset: Any, index: int, file_path: str, seen_symbols: set,
+                        errors: List[str], warnings: List[str]):
         """Validate individual asset object."""
-        asset_path = f"{file_path}[{index}]" if file_path else f"asset[{index}]"
-        
-        if not isinstance(asset, dict):
-            self.validation_errors.append(f"{asset_path}: Asset must be an object, got {type(asset).__name__}")
+        if type(asset) is not dict and not isinstance(asset, dict):
+            errors.append(f"{self._asset_path(file_path, index)}: Asset must be an object, got {type(asset).__name__}")
             return
         
         # Check required symbol field
         if 'symbol' not in asset:
-            self.validation_errors.append(f"{asset_path}: Missing required field 'symbol'")
+            errors.append(f"{self._asset_path(file_path, index)}: Missing required field 'symbol'")
         else:
             symbol = asset['symbol']
-            self._validate_symbol(symbol, asset_path, seen_symbols)
+            self._validate_symbol(symbol, file_path, index, seen_symbols, errors, warnings)
         
         # Validate optional fields
         if 'name' in asset:
-            self._validate_name(asset['name'], asset_path)
+            self._validate_name(asset['name'], file_path, index, errors)
         
         if 'assetClass' in asset:
-            self._validate_asset_class(asset['assetClass'], asset_path)
+            self._validate_asset_class(asset['assetClass'], file_path, index, errors)
         
         # Check for additional properties (warn but don't fail)
-        self._check_additional_properties(asset, asset_path)
+        self._check_additional_properties(asset, file_path, index, warnings)
     
-    def _validate_symbol(self, symbol: Any, asset_path: str, seen_symbols: set):
+    def _validate_symbol(self, symbol: Any, file_path: str, index: int, seen_symbols: set,
+                         errors: List[str], warnings: List[str]):
         """Validate symbol field."""
         if not isinstance(symbol, str):
-            self.validation_errors.append(f"{asset_path}: symbol must be a string, got {type(symbol).__name__}")
+            errors.append(f"{self._asset_path(file_path, index)}: symbol must be a string, got {type(symbol).__name__}")
             return
         
         if not symbol:
-            self.validation_errors.append(f"{asset_path}: symbol cannot be empty")
+            errors.append(f"{self._asset_path(file_path, index)}: symbol cannot be empty")
             return
         
         # Check pattern and length
-        if not self.SYMBOL_PATTERN.match(symbol):
-            self.validation_errors.append(
-                f"{asset_path}: symbol '{symbol}' does not match required pattern. "
+        if len(symbol) > self.SYMBOL_MAX_LENGTH or not self.SYMBOL_CHARS.issuperset(symbol):
+            errors.append(
+                f"{self._asset_path(file_path, index)}: symbol '{symbol}' does not match required pattern. "
                 f"Must be 1-20 characters containing only letters, numbers, and ./:-"
             )
         
-        # Check for duplicates
-        if symbol in seen_symbols:
-            self.validation_warnings.append(f"{asset_path}: Duplicate symbol '{symbol}' found in universe")
-        else:
-            seen_symbols.add(symbol)
+        # Check for duplicates; add() leaves the size unchanged for a symbol
+        # already seen, so each symbol is hashed and looked up only once
+        seen_count = len(seen_symbols)
+        seen_symbols.add(symbol)
+        if len(seen_symbols) == seen_count:
+            warnings.append(f"{self._asset_path(file_path, index)}: Duplicate symbol '{symbol}' found in universe")
     
-    def _validate_name(self, name: Any, asset_path: str):
+    def _validate_name(self, name: Any, file_path: str, index: int, errors: List[str]):
         """Validate name field if present."""
         if name is not None and not isinstance(name, str):
-            self.validation_errors.append(f"{asset_path}: name must be a string, got {type(name).__name__}")
+            errors.append(f"{self._asset_path(file_path, index)}: name must be a string, got {type(name).__name__}")
     
-    def _validate_asset_class(self, asset_class: Any, asset_path: str):
+    def _validate_asset_class(self, asset_class: Any, file_path: str, index: int, errors: List[str]):
         """Validate assetClass field if present."""
         if asset_class is None:
             return
         
         if not isinstance(asset_class, str):
-            self.validation_errors.append(f"{asset_path}: assetClass must be a string, got {type(asset_class).__name__}")
+            errors.append(f"{self._asset_path(file_path, index)}: assetClass must be a string, got {type(asset_class).__name__}")
             return
         
         if asset_class not in self.VALID_ASSET_CLASSES:
-            self.validation_errors.append(
-                f"{asset_path}: assetClass '{asset_class}' is not valid. "
-                f"Valid options: {', '.join(sorted(self.VALID_ASSET_CLASSES))}"
+            errors.append(
+                f"{self._asset_path(file_path, index)}: assetClass '{asset_class}' is not valid. "
+                f"Valid options: {self.ASSET_CLASS_OPTIONS}"
             )
     
-    def _check_additional_properties(self, asset: Dict[str, Any], asset_path: str):
+    def _check_additional_properties(self, asset: Dict[str, Any], file_path: str, index: int, warnings: List[str]):
         """Check for additional properties and warn about unexpected ones."""
-        expected_properties = {'symbol', 'name', 'assetClass'}
-        common_additional = {'exchange', 'sector', 'currency', 'market'}
+        # Common case: only schema properties, nothing to report
+        if self.ASSET_PROPERTIES.issuperset(asset):
+            return
         
         for key in asset.keys():
-            if key not in expected_properties:
-                if key in common_additional:
-                    self.validation_warnings.append(
-                        f"{asset_path}: Additional property '{key}' found (common but not in schema)"
+            if key not in self.ASSET_PROPERTIES:
+                if key in self.COMMON_ADDITIONAL_PROPERTIES:
+                    warnings.append(
+                        f"{self._asset_path(file_path, index)}: Additional property '{key}' found (common but not in schema)"
                     )
                 else:
-                    self.validation_warnings.append(
-                        f"{asset_path}: Unexpected additional property '{key}' found"
+                    warnings.append(
+                        f"{self._asset_path(file_path, index)}: Unexpected additional property '{key}' found"
                     )
     
-    def validate_sample_files(self, sample_inputs_dir: str) -> Dict[str, Tuple[bool, List[str], List[str]]]:
+    def validate_sample_files(self, sample_inputs_dir: str, use_processes: bool = False) -> Dict[str, ValidationResult]:
         """
         Validate all sample input files in the given directory.
         
         Args:
             sample_inputs_dir: Path to directory containing sample strategy files
+            use_processes: Validate on a process pool instead of a thread pool
             
         Returns:
-            Dictionary mapping file paths to validation results
+            Dictionary mapping file paths to ValidationResult tuples
         """
-        results = {}
-        sample_path = Path(sample_inputs_dir)
-        
-        if not sample_path.exists():
-            raise FileNotFoundError(f"Sample inputs directory not found: {sample_inputs_dir}")
-        
-        # Find all spec JSON files
-        spec_files = list(sample_path.glob("*/spec_*.json"))
-        
-        for spec_file in spec_files:
-            try:
-                with open(spec_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if 'universe' not in data:
-                    results[str(spec_file)] = (False, [f"No 'universe' property found"], [])
-                    continue
-                
-                is_valid, errors, warnings = self.validate_universe_property(data['universe'], str(spec_file))
-                results[str(spec_file)] = (is_valid, errors, warnings)
-                
-            except json.JSONDecodeError as e:
-                results[str(spec_file)] = (False, [f"JSON decode error: {e}"], [])
-            except Exception as e:
-                results[str(spec_file)] = (False, [f"Unexpected error: {e}"], [])
-        
-        return results
+        spec_files = find_spec_files(sample_inputs_dir)
+        return validate_spec_files(spec_files, self._validate_one_file, self.MAX_WORKERS, use_processes)
+    
+    def _validate_one_file(self, spec_file: str) -> Tuple[str, ValidationResult]:
+        """
+        Validate the universe property of a single spec file.
+        
+        Args:
+            spec_file: Path to the spec JSON file
+        
+        Returns:
+            Tuple of (spec_file, ValidationResult)
+        """
+        try:
+            data = load_json_file(spec_file)
+            
+            if 'universe' not in data:
+                return spec_file, ValidationResult(False, [f"No 'universe' property found"], [])
+            
+            return spec_file, ValidationResult(*self.validate_universe_property(data['universe'], spec_file))
+        
+        except json.JSONDecodeError as e:
+            return spec_file, ValidationResult(False, [f"JSON decode error: {e}"], [])
+        except Exception as e:
+            return spec_file, ValidationResult(False, [f"Unexpected error: {e}"], [])
     
     def generate_validation_report(self, results: Dict[str, Tuple[bool, List[str], List[str]]]) -> str:
         """Generate a human-readable validation report."""
-        report_lines = []
-        report_lines.append("Universe Property Validation Report")
-        report_lines.append("=" * 38)
-        report_lines.append("")
-        
         total_files = len(results)
         valid_files = sum(1 for is_valid, _, _ in results.values() if is_valid)
         
-        report_lines.append(f"Total files validated: {total_files}")
-        report_lines.append(f"Valid files: {valid_files}")
-        report_lines.append(f"Invalid files: {total_files - valid_files}")
-        report_lines.append("")
+        report_lines = [
+            "Universe Property Validation Report",
+            "=" * 38,
+            "",
+            f"Total files validated: {total_files}",
+            f"Valid files: {valid_files}",
+            f"Invalid files: {total_files - valid_files}",
+            "",
+        ]
         
         for file_path, (is_valid, errors, warnings) in results.items():
-            filename = Path(file_path).name
             status = "[VALID]" if is_valid else "[INVALID]"
-            report_lines.append(f"{status}: {filename}")
-            
-            if errors:
-                for error in errors:
-                    # Remove file path prefix from error message for cleaner display
-                    clean_error = error.split(": ", 1)[-1] if ": " in error else error
-                    report_lines.append(f"  ERROR: {clean_error}")
+            report_lines.append(f"{status}: {os.path.basename(file_path)}")
             
-            if warnings:
-                for warning in warnings:
-                    clean_warning = warning.split(": ", 1)[-1] if ": " in warning else warning
-                    report_lines.append(f"  WARNING: {clean_warning}")
+            # Remove file path prefix from messages for cleaner display
+            report_lines.extend([f"  ERROR: {error.split(': ', 1)[-1]}" for error in errors])
+            report_lines.extend([f"  WARNING: {warning.split(': ', 1)[-1]}" for warning in warnings])
             
             report_lines.append("")
         